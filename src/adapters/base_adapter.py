@@ -93,12 +93,12 @@ class BaseAdapter(ABC):
         pass
     
     @abstractmethod
-    async def wait_for_login(self) -> bool:
+    async def wait_for_login(self) -> tuple:
         """
         等待用户手动登录
         
         Returns:
-            登录是否成功
+            (登录是否成功, 账号昵称)，未获取到昵称时为空字符串
         """
         pass
     
@@ -4,8 +4,10 @@
 """
 
 import asyncio
+import hashlib
+import json
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 from src.core.logger import get_logger
@@ -24,9 +26,28 @@ class BrowserManager:
         self._pages: Dict[str, Page] = {}
         self._initialized = False
         self._current_loop = None  # 记录当前的event loop
+        # 账号ID -> (上次保存的登录状态摘要, 写入后文件的 (mtime_ns, size))
+        self._storage_hashes: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+        # 初始化锁：多个发布任务/登录可能同时调用 initialize()，
+        # 只允许一个协程启动 Playwright（锁属于创建它的 event loop，loop 变化时重建）
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._init_lock_loop = None
+
+    def _get_init_lock(self) -> asyncio.Lock:
+        """获取当前 event loop 上的初始化锁"""
+        loop = asyncio.get_running_loop()
+        if self._init_lock is None or self._init_lock_loop is not loop:
+            self._init_lock = asyncio.Lock()
+            self._init_lock_loop = loop
+        return self._init_lock
 
     async def initialize(self):
-        """初始化Playwright"""
+        """初始化Playwright（并发调用时只会初始化一次）"""
+        async with self._get_init_lock():
+            await self._initialize_locked()
+
+    async def _initialize_locked(self):
+        """初始化Playwright（调用方已持有初始化锁）"""
         current_loop = asyncio.get_running_loop()  # 使用 get_running_loop 更可靠
 
         logger.debug(f"initialize() 调用 - current_loop={id(current_loop)}, saved_loop={id(self._current_loop) if self._current_loop else None}")
@@ -53,26 +74,6 @@ class BrowserManager:
         await self._force_reinitialize(skip_cleanup=False)
         self._current_loop = current_loop
 
-    async def reinitialize_for_new_loop(self):
-        """在新的 event loop 中强制重新初始化
-
-        当从不同的 QThread/event loop 调用时使用此方法，
-        确保 Playwright 资源在当前 event loop 中正确初始化。
-        """
-        current_loop = asyncio.get_running_loop()
-
-        # 如果 event loop 没变且浏览器已连接，跳过
-        if (self._current_loop == current_loop and
-            self._initialized and self._browser and
-            self._browser.is_connected()):
-            logger.info("浏览器已在当前 event loop 中初始化，跳过重新初始化")
-            return
-
-        logger.info(f"为新的 event loop 重新初始化浏览器...")
-        # 丢弃旧引用（不尝试清理，因为它们属于旧 event loop）
-        await self._force_reinitialize(skip_cleanup=True)
-        self._current_loop = current_loop
-
     async def _force_reinitialize(self, skip_cleanup: bool = False):
         """强制重新初始化Playwright
 
@@ -183,17 +184,70 @@ class BrowserManager:
 
         return page
     
+    @staticmethod
+    def _state_digest(state: dict) -> bytes:
+        """登录状态摘要（键排序后序列化，内容相同则摘要相同）"""
+        return hashlib.blake2b(json.dumps(state, sort_keys=True).encode('utf-8'), digest_size=16).digest()
+
+    @staticmethod
+    def _file_key(path: str) -> Optional[Tuple[int, int]]:
+        """文件的 (mtime_ns, size)，文件不存在时返回 None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     async def save_storage_state(self, account_id: str, profile_dir: str):
-        """保存浏览器状态（Cookie等）"""
+        """保存浏览器状态（Cookie等）
+
+        每篇文章发布后都会调用；状态与上次保存的相同时跳过写文件。
+        """
         if account_id not in self._contexts:
             return
         
         storage_path = os.path.join(BROWSER_PROFILES_DIR, profile_dir)
         storage_state_file = os.path.join(storage_path, 'storage_state.json')
-        
-        await self._contexts[account_id].storage_state(path=storage_state_file)
+
+        state = await self._contexts[account_id].storage_state()
+        digest = self._state_digest(state)
+
+        # 缓存的摘要只在文件仍是上次写入的那个时有效；文件被删除、在程序外修改，
+        # 或同一账号ID对应的新账号重新生成了文件时，以磁盘上的内容为准
+        file_key = self._file_key(storage_state_file)
+        cached = self._storage_hashes.get(account_id)
+        if file_key is None:
+            cached = None
+        elif cached is None or cached[1] != file_key:
+            try:
+                with open(storage_state_file, 'r', encoding='utf-8') as f:
+                    cached = (self._state_digest(json.load(f)), file_key)
+            except Exception:
+                cached = None
+
+        if cached is not None and cached[0] == digest:
+            self._storage_hashes[account_id] = cached
+            logger.debug(f"登录状态未变化，跳过保存: {account_id}")
+            return
+
+        # 先写临时文件再原子替换，写入中途退出也不会留下半个 storage_state.json
+        os.makedirs(storage_path, exist_ok=True)
+        tmp_file = storage_state_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_file, storage_state_file)
+        self._storage_hashes[account_id] = (digest, self._file_key(storage_state_file))
         logger.info(f"已保存登录状态: {account_id}")
     
+    async def close_page(self, account_id: str):
+        """只关闭指定账号的页面，保留上下文（Cookie 仍在内存中，下次直接新建页面）"""
+        page = self._pages.pop(account_id, None)
+        if page is not None:
+            try:
+                await page.close()
+            except:
+                pass
+
     async def close_context(self, account_id: str):
         """关闭指定账号的上下文"""
         if account_id in self._pages:
@@ -205,8 +259,8 @@ class BrowserManager:
             del self._contexts[account_id]
             logger.info(f"已关闭浏览器上下文: {account_id}")
     
-    async def close_all(self):
-        """关闭所有资源"""
+    async def close_contexts_only(self):
+        """关闭所有页面和上下文，保留浏览器进程供下次任务复用"""
         for account_id in list(self._pages.keys()):
             try:
                 await self._pages[account_id].close()
@@ -220,6 +274,11 @@ class BrowserManager:
             except:
                 pass
         self._contexts.clear()
+        logger.info("已关闭所有浏览器上下文（浏览器保持运行）")
+
+    async def close_all(self):
+        """关闭所有资源"""
+        await self.close_contexts_only()
 
         if self._browser:
             try:
@@ -0,0 +1,59 @@
+"""
+后台常驻事件循环
+所有异步任务（Playwright、调度器）都在同一个 event loop 中运行，
+避免每次任务新建 loop 后重新初始化浏览器
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+
+class EventLoopThread:
+    """在守护线程中运行的常驻 event loop"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """获取事件循环（首次访问时启动后台线程）"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            return self._loop
+
+    def _start(self):
+        """启动后台线程并等待 loop 就绪"""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=_run, name="EventLoopThread", daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+        logger.debug(f"后台 event loop 已启动: {id(loop)}")
+
+    def submit(self, coro: Coroutine) -> Future:
+        """提交协程到后台 loop，立即返回 Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """提交协程并阻塞等待结果（不可在 loop 线程内调用）"""
+        return self.submit(coro).result()
+
+
+# 全局事件循环实例
+event_loop_thread = EventLoopThread()
@@ -4,7 +4,8 @@
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
 
@@ -18,6 +19,13 @@ from src.utils.config import config
 
 logger = get_logger()
 
+# 平台 -> 适配器类
+ADAPTER_CLASSES: Dict[str, type] = {
+    'toutiao': ToutiaoAdapter,
+    'sohu': SohuAdapter,
+    'baijiahao': BaijiahaoAdapter,
+}
+
 
 class TaskStatus(Enum):
     """任务状态"""
@@ -28,7 +36,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class PublishTask:
     """发布任务"""
     account_id: str
@@ -39,7 +47,7 @@ class PublishTask:
     result: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountTask:
     """账号任务配置"""
     account_id: str
@@ -53,16 +61,21 @@ class AccountTask:
 class Scheduler:
     """任务调度器（支持并行发布）"""
 
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 1):
+        """
+        Args:
+            max_concurrent: 同时执行的账号数量，1 表示逐个账号串行执行
+        """
         self.excel_reader = ExcelReader()
         self.tasks: List[PublishTask] = []
         self.account_tasks: List[AccountTask] = []
+        self._account_index: Dict[str, AccountTask] = {}  # account_id -> AccountTask
         self._running = False
         self._cancelled = False
         self._adapters: Dict[str, BaseAdapter] = {}
 
         # 并行配置
-        self.max_concurrent: int = 3  # 默认最大并发数
+        self.max_concurrent: int = max(1, min(max_concurrent, 10))  # 限制1-10
 
         # 回调函数
         self.on_task_start: Optional[Callable[[PublishTask], None]] = None
@@ -73,7 +86,11 @@ class Scheduler:
         # 并行执行时的进度跟踪
         self._completed_count = 0
         self._total_count = 0
-        self._progress_lock = asyncio.Lock() if asyncio.get_event_loop().is_running() else None
+        self._progress_dirty = False
+
+        # 运行中的 event loop 和 worker 任务，供 cancel() 跨线程中断
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
     
     def load_accounts(self) -> List[AccountTask]:
         """加载所有账号"""
@@ -90,8 +107,13 @@ class Scheduler:
             )
             self.account_tasks.append(account_task)
 
+        self._account_index = {acc.account_id: acc for acc in self.account_tasks}
         return self.account_tasks
 
+    def get_account(self, account_id: str) -> Optional[AccountTask]:
+        """根据ID获取账号任务"""
+        return self._account_index.get(account_id)
+
     def add_account(self, platform: str) -> AccountTask:
         """添加新账号
 
@@ -113,6 +135,7 @@ class Scheduler:
             enabled=new_acc.get('enabled', True)
         )
         self.account_tasks.append(account_task)
+        self._account_index[account_task.account_id] = account_task
 
         logger.info(f"已添加新账号: {account_task.account_name}")
         return account_task
@@ -132,6 +155,7 @@ class Scheduler:
         if success:
             # 从内存中的账号任务列表移除
             self.account_tasks = [acc for acc in self.account_tasks if acc.account_id != account_id]
+            self._account_index.pop(account_id, None)
             logger.info(f"已删除账号: {account_id}")
 
         return success
@@ -142,8 +166,7 @@ class Scheduler:
         Args:
             new_order: 账号ID的新顺序列表
         """
-        # 创建ID到AccountTask的映射
-        account_map = {acc.account_id: acc for acc in self.account_tasks}
+        account_map = self._account_index
 
         # 按新顺序重建列表
         reordered = []
@@ -152,8 +175,9 @@ class Scheduler:
                 reordered.append(account_map[account_id])
 
         # 添加不在新顺序中的账号（防止丢失）
+        ordered_ids = set(new_order)
         for acc in self.account_tasks:
-            if acc.account_id not in new_order:
+            if acc.account_id not in ordered_ids:
                 reordered.append(acc)
 
         self.account_tasks = reordered
@@ -169,11 +193,10 @@ class Scheduler:
     
     def set_account_publish_count(self, account_id: str, count: int):
         """设置账号发布数量"""
-        for task in self.account_tasks:
-            if task.account_id == account_id:
-                task.publish_count = count
-                logger.info(f"设置 {task.account_name} 发布数量: {count}")
-                break
+        task = self._account_index.get(account_id)
+        if task:
+            task.publish_count = count
+            logger.info(f"设置 {task.account_name} 发布数量: {count}")
     
     def generate_tasks(self) -> List[PublishTask]:
         """生成发布任务队列"""
@@ -181,25 +204,26 @@ class Scheduler:
         article_index = 0
         articles = self.excel_reader.get_articles()
         
-        # 按账号生成任务
+        # 按账号生成任务：每个账号按发布数量整段切取文章
         for account_task in self.account_tasks:
             if not account_task.enabled or account_task.publish_count <= 0:
                 continue
-            
-            for i in range(account_task.publish_count):
-                if article_index >= len(articles):
-                    logger.warning("文章数量不足，停止生成任务")
-                    break
-                
-                article = articles[article_index]
-                task = PublishTask(
+
+            end_index = article_index + account_task.publish_count
+            self.tasks.extend(
+                PublishTask(
                     account_id=account_task.account_id,
                     account_name=account_task.account_name,
                     platform=account_task.platform,
                     article=article
                 )
-                self.tasks.append(task)
-                article_index += 1
+                for article in articles[article_index:end_index]
+            )
+            article_index = min(end_index, len(articles))
+
+            if end_index > len(articles):
+                logger.warning("文章数量不足，停止生成任务")
+                break
         
         logger.info(f"共生成 {len(self.tasks)} 个发布任务")
         return self.tasks
@@ -212,15 +236,11 @@ class Scheduler:
         account = config.get_account_by_id(task.account_id)
         profile_dir = account['profile_dir'] if account else task.account_id
         
-        if task.platform == 'toutiao':
-            adapter = ToutiaoAdapter(task.account_id, profile_dir, task.account_name)
-        elif task.platform == 'sohu':
-            adapter = SohuAdapter(task.account_id, profile_dir, task.account_name)
-        elif task.platform == 'baijiahao':
-            adapter = BaijiahaoAdapter(task.account_id, profile_dir, task.account_name)
-        else:
+        adapter_class = ADAPTER_CLASSES.get(task.platform)
+        if adapter_class is None:
             raise ValueError(f"不支持的平台: {task.platform}")
-        
+        adapter = adapter_class(task.account_id, profile_dir, task.account_name)
+
         self._adapters[task.account_id] = adapter
         return adapter
     
@@ -236,42 +256,68 @@ class Scheduler:
         self._log(f"设置并发数: {self.max_concurrent}")
 
     async def run(self):
-        """运行所有任务（串行模式）"""
+        """运行所有任务（按账号分组，由 max_concurrent 个 worker 从队列中领取执行）"""
         if self._running:
             logger.warning("调度器已在运行中")
             return
 
         self._running = True
-        self._cancelled = False
+        # 不在这里清除取消标志（由 reset() 负责）：run() 尚未在 loop 中开始时点击的停止，
+        # 只会设置 _cancelled，必须保留下来让 worker 直接跳过所有任务
+        self._loop = asyncio.get_running_loop()
         self._completed_count = 0
         self._total_count = len(self.tasks)
 
-        self._log(f"开始执行 {self._total_count} 个发布任务（串行模式）...")
-
         # 按账号分组任务
-        account_task_groups: Dict[str, List[PublishTask]] = {}
+        account_task_groups: Dict[str, List[PublishTask]] = defaultdict(list)
         for task in self.tasks:
-            if task.account_id not in account_task_groups:
-                account_task_groups[task.account_id] = []
             account_task_groups[task.account_id].append(task)
 
+        worker_count = max(1, min(self.max_concurrent, len(account_task_groups)))
+        self._log(f"开始执行 {self._total_count} 个发布任务（并发数: {worker_count}）...")
         self._log(f"共 {len(account_task_groups)} 个账号参与发布")
 
-        # 串行执行每个账号的任务
+        # 同一账号的任务作为一个整体入队，保证每个账号的页面只被一个 worker 使用
+        queue: asyncio.Queue = asyncio.Queue()
         for account_id, tasks in account_task_groups.items():
-            if self._cancelled:
-                break
-            await self._run_account_tasks_serial(account_id, tasks)
+            queue.put_nowait((account_id, tasks))
+        for _ in range(worker_count):
+            queue.put_nowait(None)  # 结束标记
+
+        self._workers = [asyncio.create_task(self._worker(queue)) for _ in range(worker_count)]
+        # 取消时 worker 会被直接中断，这里只需等待它们全部结束
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._loop = None
 
         self._running = False
 
+        # 被中断的任务和取消时尚未开始的任务标记为失败
+        for task in self.tasks:
+            if task.status is TaskStatus.RUNNING or (self._cancelled and task.status is TaskStatus.PENDING):
+                task.status = TaskStatus.FAILED
+                task.result = {'success': False, 'message': '已取消'}
+
         # 统计结果
-        success_count = sum(1 for t in self.tasks if t.status == TaskStatus.SUCCESS)
-        failed_count = sum(1 for t in self.tasks if t.status == TaskStatus.FAILED)
+        success_count = sum(1 for t in self.tasks if t.status is TaskStatus.SUCCESS)
+        failed_count = sum(1 for t in self.tasks if t.status is TaskStatus.FAILED)
         self._log(f"🎉 发布完成! 成功: {success_count}, 失败: {failed_count}")
         self._log("所有任务已完成!")
         self._adapters.clear()
 
+    async def _worker(self, queue: asyncio.Queue):
+        """从队列中依次领取账号任务组并执行，遇到结束标记时退出"""
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                if not self._cancelled:
+                    account_id, tasks = item
+                    await self._run_account_tasks_serial(account_id, tasks)
+            finally:
+                queue.task_done()
+
     async def _run_account_tasks_serial(self, account_id: str, tasks: List[PublishTask]):
         """串行运行单个账号的所有任务"""
         if self._cancelled:
@@ -284,7 +330,8 @@ class Scheduler:
             # 获取适配器
             adapter = self._get_adapter(tasks[0])
 
-            # 检查登录状态
+            # 检查登录状态：同一账号的任务组只交给一个 worker 串行执行，
+            # 每次运行中每个账号只在这里检查一次，无需在 worker 之间共享结果
             if self._cancelled:
                 return
 
@@ -292,7 +339,8 @@ class Scheduler:
 
             if not is_logged_in:
                 self._log(f"[{account_name}] 需要登录，请在浏览器中手动登录...")
-                login_success = await adapter.wait_for_login()
+                # wait_for_login 返回 (success, nickname) 元组，失败时为 (False, "")
+                login_success, _ = await adapter.wait_for_login()
                 if self._cancelled:
                     return
                 if not login_success:
@@ -313,7 +361,7 @@ class Scheduler:
         except Exception as e:
             self._log(f"❌ [{account_name}] 账号执行异常: {e}")
             for task in tasks:
-                if task.status == TaskStatus.PENDING:
+                if task.status is TaskStatus.PENDING:
                     task.status = TaskStatus.FAILED
                     task.result = {'success': False, 'message': str(e)}
                     await self._update_progress(task)
@@ -324,11 +372,18 @@ class Scheduler:
         """执行单个发布任务"""
         import random
 
+        # 已取消的任务直接返回，不再标记为运行中或触发回调
+        if self._cancelled:
+            return
+
         task.status = TaskStatus.RUNNING
         if self.on_task_start:
             self.on_task_start(task)
 
-        self._log(f"📝 [{task.account_name}] 正在发布: {task.article.title[:30]}...")
+        # 同一任务的日志共用账号前缀和截断后的标题
+        prefix = f"[{task.account_name}]"
+        short_title = task.article.title[:30]
+        self._log(f"📝 {prefix} 正在发布: {short_title}...")
 
         try:
             if self._cancelled:
@@ -341,15 +396,15 @@ class Scheduler:
             if result['success']:
                 task.status = TaskStatus.SUCCESS
                 self.excel_reader.mark_as_published(task.article, "success")
-                self._log(f"✅ [{task.account_name}] 发布成功: {task.article.title[:30]}...")
+                self._log(f"✅ {prefix} 发布成功: {short_title}...")
             else:
                 task.status = TaskStatus.FAILED
-                self._log(f"❌ [{task.account_name}] 发布失败: {result['message']}")
+                self._log(f"❌ {prefix} 发布失败: {result['message']}")
 
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.result = {'success': False, 'message': str(e)}
-            self._log(f"❌ [{task.account_name}] 发布异常: {e}")
+            self._log(f"❌ {prefix} 发布异常: {e}")
 
         await self._update_progress(task)
 
@@ -362,25 +417,47 @@ class Scheduler:
         """更新进度（线程安全）"""
         self._completed_count += 1
 
-        if self.on_progress:
-            self.on_progress(self._completed_count, self._total_count)
+        # 同一轮事件循环内的多次进度变化合并为一次回调
+        if self.on_progress and not self._progress_dirty:
+            self._progress_dirty = True
+            asyncio.get_running_loop().call_soon(self._flush_progress)
 
         if self.on_task_complete:
             self.on_task_complete(task)
 
+    def _flush_progress(self):
+        """推送最新进度"""
+        self._progress_dirty = False
+        if self.on_progress:
+            self.on_progress(self._completed_count, self._total_count)
+
     def cancel(self):
-        """取消任务"""
+        """取消任务（可在任意线程调用）
+
+        除了设置取消标志，还会在 event loop 中直接取消 worker 任务，
+        正在等待的 Playwright 操作或任务间延迟会立即抛出 CancelledError 退出。
+        """
         self._cancelled = True
         self._running = False
         self._log("正在取消任务...")
 
-        # 通知所有适配器取消
-        for adapter in self._adapters.values():
-            try:
-                if hasattr(adapter, 'cancel'):
-                    adapter.cancel()
-            except Exception:
-                pass
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            # 适配器字典由 loop 线程中的 worker 修改，统一在 loop 线程中遍历
+            loop.call_soon_threadsafe(self._cancel_workers)
+        else:
+            self._cancel_adapters()
+
+    def _cancel_adapters(self):
+        """通知所有适配器取消（BaseAdapter.cancel 只设置标志位）"""
+        for adapter in list(self._adapters.values()):
+            adapter.cancel()
+
+    def _cancel_workers(self):
+        """取消所有适配器和 worker 任务（在 event loop 线程中执行）"""
+        self._cancel_adapters()
+        for worker in self._workers:
+            worker.cancel()
 
     def reset(self):
         """重置调度器状态（在新任务开始前调用）"""
@@ -2,139 +2,348 @@
 主窗口
 """
 
-import asyncio
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import strftime
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGroupBox, QListWidget, QListWidgetItem, QPushButton,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QGroupBox, QListView, QPushButton,
     QLabel, QSpinBox, QTextEdit, QFileDialog, QMessageBox,
     QProgressBar, QSplitter, QTableWidget, QTableWidgetItem,
-    QHeaderView, QCheckBox, QFrame
+    QTableView, QAbstractItemView, QStyledItemDelegate,
+    QHeaderView
+)
+from PySide6.QtCore import (
+    Qt, QThreadPool, QRunnable, QSignalBlocker, Signal, QTimer,
+    QAbstractTableModel, QModelIndex, QStringListModel
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont, QTextCursor
 
-from src.core.scheduler import scheduler, PublishTask, TaskStatus
+from src.core.event_loop import event_loop_thread
 from src.core.logger import get_logger
 
 logger = get_logger()
 
+# 日志面板保留的最大行数
+_LOG_MAX_LINES = 2000
 
-class AsyncWorker(QThread):
-    """异步任务工作线程"""
-    finished = Signal()
-    error = Signal(str)
-    log_message = Signal(str)
-    progress = Signal(int, int)
-    task_updated = Signal(object)
+# 已登录按钮样式：设置在账号表格上按动态属性匹配，不再逐个按钮解析样式表
+_LOGIN_BTN_QSS = 'QPushButton[loggedIn="true"] { background-color: #4CAF50; color: white; }'
 
-    def __init__(self, task_type: str = "publish", **kwargs):
-        super().__init__()
-        self._loop = None
-        self._task_type = task_type  # "publish" 或 "login"
-        self._kwargs = kwargs
 
-    def run(self):
-        """运行异步任务"""
-        try:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+@dataclass(slots=True)
+class LoginResult:
+    """登录结果"""
+    account_id: str
+    success: bool
+    nickname: str = ""
+    error: str = ""  # 登录过程抛出异常时的错误信息
 
-            if self._task_type == "publish":
-                self._run_publish_task()
-            elif self._task_type == "login":
-                self._run_login_task()
-            elif self._task_type == "open_browser":
-                self._run_open_browser_task()
 
-            self.finished.emit()
-        except Exception as e:
-            self.error.emit(str(e))
-        finally:
-            # 不关闭loop，因为浏览器可能还在使用
-            pass
+async def _login(adapter, account_id: str) -> LoginResult:
+    """等待用户登录"""
+    from src.browser.browser_manager import browser_manager
 
-    def _run_publish_task(self):
-        """运行发布任务"""
-        from src.browser.browser_manager import browser_manager
+    try:
+        success, nickname = await adapter.wait_for_login()
+    finally:
+        # 登录结束后只关闭页面，上下文和浏览器进程保留给后续发布直接复用，
+        # 无需再从 storage_state.json 重新创建；停止发布时统一关闭上下文
+        await browser_manager.close_page(account_id)
 
-        # 设置回调
-        scheduler.on_log = lambda msg: self.log_message.emit(msg)
-        scheduler.on_progress = lambda c, t: self.progress.emit(c, t)
-        scheduler.on_task_complete = lambda t: self.task_updated.emit(t)
+    return LoginResult(account_id, success, nickname)
 
-        # 在新的 event loop 中，强制重新初始化浏览器
-        # 这是因为 Playwright 资源绑定到创建它们的 event loop
-        self._loop.run_until_complete(browser_manager.reinitialize_for_new_loop())
 
-        self._loop.run_until_complete(scheduler.run())
+class LoadArticlesRunnable(QRunnable):
+    """在线程池中读取文章表格，避免阻塞界面"""
 
-    def _run_login_task(self):
-        """运行登录任务"""
-        from src.adapters.toutiao_adapter import ToutiaoAdapter
-        from src.adapters.sohu_adapter import SohuAdapter
-        from src.adapters.baijiahao_adapter import BaijiahaoAdapter
-        from src.browser.browser_manager import browser_manager
+    def __init__(self, file_path: str, done_signal):
+        super().__init__()
+        self._file_path = file_path
+        self._done_signal = done_signal  # 完成信号 (file_path, success, labels)
 
-        account_id = self._kwargs.get('account_id')
-        account_name = self._kwargs.get('account_name')
-        platform = self._kwargs.get('platform')
-        profile_dir = self._kwargs.get('profile_dir')
+    def run(self):
+        from src.core.scheduler import scheduler
 
-        if platform == 'toutiao':
-            adapter = ToutiaoAdapter(account_id, profile_dir, account_name)
-        elif platform == 'baijiahao':
-            adapter = BaijiahaoAdapter(account_id, profile_dir, account_name)
-        else:
-            adapter = SohuAdapter(account_id, profile_dir, account_name)
+        labels = []
+        try:
+            success = scheduler.load_articles(self._file_path)
+            if success:
+                # 列表显示文本也在线程池中生成，主线程只需一次 addItems
+                labels = [f"{article.index}. {article.title}" for article in scheduler.get_articles()]
+        except Exception as e:
+            logger.error(f"加载文章失败: {e}")
+            success = False
+        self._done_signal.emit(self._file_path, success, labels)
 
-        result = self._loop.run_until_complete(adapter.wait_for_login())
 
-        # wait_for_login 现在返回 (success, nickname) 元组
-        if isinstance(result, tuple):
-            success, nickname = result
-        else:
-            # 兼容旧版本返回bool的情况
-            success = result
-            nickname = ""
+class PreloadModulesRunnable(QRunnable):
+    """在线程池中预先导入调度器、平台适配器和浏览器管理模块
 
-        # 登录成功后，关闭浏览器以释放资源
-        # 登录状态已保存到 storage_state.json，发布时会重新加载
-        self._loop.run_until_complete(browser_manager.cleanup())
+    这些模块会连带导入 Playwright，首次导入较慢；放到后台线程完成后，
+    界面线程和登录线程中的函数级 import 只是一次字典查找。
+    """
 
-        self._kwargs['success'] = success
-        self._kwargs['nickname'] = nickname
+    def __init__(self, done_signal):
+        super().__init__()
+        self._done_signal = done_signal  # 完成信号
 
-    def _run_open_browser_task(self):
-        """运行打开浏览器任务"""
-        from src.browser.browser_manager import browser_manager
+    def run(self):
+        try:
+            from src.core.scheduler import scheduler  # noqa: F401
+            from src.adapters.toutiao_adapter import ToutiaoAdapter  # noqa: F401
+            from src.adapters.sohu_adapter import SohuAdapter  # noqa: F401
+            from src.adapters.baijiahao_adapter import BaijiahaoAdapter  # noqa: F401
+            from src.browser.browser_manager import browser_manager  # noqa: F401
+        except Exception as e:
+            logger.error(f"预加载模块失败: {e}")
+        finally:
+            self._done_signal.emit()
+
+
+class TaskTableModel(QAbstractTableModel):
+    """发布配置表模型
+
+    直接读取 AccountTask 的名称和发布数量，不再为每个单元格创建 QTableWidgetItem，
+    名称或数量变化时只刷新对应的行。
+    """
+
+    HEADERS = ("账号", "发布数量", "状态")
+    COUNT_COLUMN = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accounts: list = []          # AccountTask 列表（按显示顺序）
+        self._rows: dict[str, int] = {}    # account_id -> 行号
+        self._status: dict[str, str] = {}  # account_id -> 状态文本
+        self._counts: dict[str, list] = {}  # 本次发布中 account_id -> [已完成, 成功, 总数]
+
+    def _reindex(self):
+        self._rows = {acc.account_id: row for row, acc in enumerate(self._accounts)}
+
+    def set_accounts(self, accounts: list):
+        """整体替换账号列表"""
+        self.beginResetModel()
+        self._accounts = list(accounts)
+        self._status.clear()
+        self._reindex()
+        self.endResetModel()
+
+    def append_account(self, acc):
+        """在末尾添加一个账号"""
+        row = len(self._accounts)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._accounts.append(acc)
+        self._rows[acc.account_id] = row
+        self.endInsertRows()
+
+    def remove_account(self, account_id: str):
+        """移除指定账号"""
+        row = self._rows.get(account_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._accounts[row]
+        self._status.pop(account_id, None)
+        self._reindex()
+        self.endRemoveRows()
 
-        account_id = self._kwargs.get('account_id')
-        profile_dir = self._kwargs.get('profile_dir')
-        start_url = self._kwargs.get('start_url')
+    def reorder(self, new_order: list):
+        """按账号ID顺序重排（不在新顺序中的账号保持原相对顺序排在末尾）
 
-        # 打开独立浏览器（不受程序管理）
-        self._loop.run_until_complete(
-            browser_manager.open_standalone_browser(account_id, profile_dir, start_url)
+        逐行移动到目标位置而不是重置模型，拖动一行时只产生一次行移动，
+        视图中的选中和编辑状态得以保留。
+        """
+        position = {account_id: i for i, account_id in enumerate(new_order)}
+        target = sorted(self._accounts, key=lambda acc: position.get(acc.account_id, len(position)))
+
+        for row, acc in enumerate(target):
+            if self._accounts[row] is acc:
+                continue
+            source = self._accounts.index(acc, row + 1)
+            self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+            self._accounts.insert(row, self._accounts.pop(source))
+            self.endMoveRows()
+
+        self._reindex()
+
+    def refresh_account(self, account_id: str):
+        """账号名称等信息变化后刷新对应行"""
+        row = self._rows.get(account_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def _refresh_status(self, rows=None):
+        """刷新状态列（rows 为空时刷新整列）"""
+        column = len(self.HEADERS) - 1
+        if rows is None:
+            if self._accounts:
+                self.dataChanged.emit(self.index(0, column), self.index(len(self._accounts) - 1, column))
+            return
+        for row in rows:
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index)
+
+    def begin_run(self, tasks: list):
+        """开始发布：按账号统计任务数，参与发布的账号显示为等待中"""
+        self._counts = {}
+        for task in tasks:
+            self._counts.setdefault(task.account_id, [0, 0, 0])[2] += 1
+        self._status = {account_id: f"等待中 0/{total}" for account_id, (_, _, total) in self._counts.items()}
+        self._refresh_status()
+
+    def task_finished(self, task):
+        """单个发布任务结束后更新所属账号的状态"""
+        from src.core.scheduler import TaskStatus
+
+        counts = self._counts.get(task.account_id)
+        if counts is None:
+            return
+        counts[0] += 1
+        if task.status is TaskStatus.SUCCESS:
+            counts[1] += 1
+        done, success, total = counts
+        self._status[task.account_id] = (
+            f"完成 成功{success}/{total}" if done == total else f"发布中 {done}/{total}"
         )
+        row = self._rows.get(task.account_id)
+        if row is not None:
+            self._refresh_status([row])
+
+    def end_run(self):
+        """发布结束：还有任务未完成的账号标记为已停止"""
+        for account_id, (done, success, total) in self._counts.items():
+            if done < total:
+                self._status[account_id] = f"已停止 成功{success}/{total}"
+        self._counts = {}
+        self._refresh_status()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        acc = self._accounts[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            column = index.column()
+            if column == 0:
+                return acc.account_name
+            if column == self.COUNT_COLUMN:
+                return acc.publish_count
+            return self._status.get(acc.account_id, "待配置")
+        if role == Qt.UserRole:
+            return acc.account_id
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == self.COUNT_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        from src.core.scheduler import scheduler
+
+        if role != Qt.EditRole or index.column() != self.COUNT_COLUMN:
+            return False
+
+        acc = self._accounts[index.row()]
+        scheduler.set_account_publish_count(acc.account_id, int(value))
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+
+class PublishCountDelegate(QStyledItemDelegate):
+    """发布数量编辑器（0-100）"""
+
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setRange(0, 100)
+        return editor
 
 
 class MainWindow(QMainWindow):
     """主窗口"""
 
     # 自定义信号
-    _login_finished_signal = Signal(bool, str)  # success, nickname
+    _login_finished_signal = Signal(object)  # LoginResult
+    _articles_loaded_signal = Signal(str, bool, list)  # file_path, success, 文章列表显示文本
+    _modules_preloaded_signal = Signal()
+    _browser_opened_signal = Signal(str, str)  # account_id, 错误信息（成功时为空）
+    _stop_error_signal = Signal(str)  # 停止时关闭浏览器的错误信息（成功时为空）
+    # 发布任务的回调在后台 event loop 线程中触发，经信号排队到主线程
+    _publish_log_signal = Signal(str)
+    _publish_progress_signal = Signal(int, int)
+    _task_updated_signal = Signal(object)  # PublishTask
+    _publish_finished_signal = Signal(str)  # 错误信息（成功时为空）
 
     def __init__(self):
         super().__init__()
-        self.worker = None
-        self._current_login_btn = None
+        # 正在运行的发布任务（scheduler.run() 在后台 event loop 中的 Future）
+        self._publish_future = None
+        # 用户点击了停止，本次任务结束时不弹出完成提示
+        self._stop_requested = False
+
+        # account_id -> 账号表行号索引
+        self._account_rows: dict[str, int] = {}
+
+        # 手动修改的账号名称先暂存，停止编辑 500ms 后统一写入配置文件
+        self._pending_names: dict[str, str] = {}
+        self._name_save_timer = QTimer(self)
+        self._name_save_timer.setSingleShot(True)
+        self._name_save_timer.setInterval(500)
+        self._name_save_timer.timeout.connect(self._flush_pending_names)
+
+        # 拖拽排序期间可能连续触发多次 sectionMoved，结束 100ms 后才保存一次
+        self._reorder_timer = QTimer(self)
+        self._reorder_timer.setSingleShot(True)
+        self._reorder_timer.setInterval(100)
+        self._reorder_timer.timeout.connect(self._commit_account_order)
 
         # 连接信号
-        self._login_finished_signal.connect(self._on_login_finished)
+        # 登录信号在后台 event loop 线程中发出，排队到主线程处理
+        self._login_finished_signal.connect(self._on_login_finished, Qt.QueuedConnection)
+        self._articles_loaded_signal.connect(self._on_articles_loaded)
+        self._modules_preloaded_signal.connect(self.load_accounts)
+        self._browser_opened_signal.connect(self._on_browser_opened)
+        self._stop_error_signal.connect(self._on_stop_error, Qt.QueuedConnection)
+        self._publish_log_signal.connect(self.log, Qt.QueuedConnection)
+        self._publish_progress_signal.connect(self.on_progress, Qt.QueuedConnection)
+        self._task_updated_signal.connect(self._on_task_updated, Qt.QueuedConnection)
+        self._publish_finished_signal.connect(self._on_publish_finished, Qt.QueuedConnection)
+
+        # 程序退出前写入未保存的账号名称和顺序，并在后台事件循环中关闭浏览器
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_names)
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_order)
+        QApplication.instance().aboutToQuit.connect(self._close_browser_on_quit)
 
         self.init_ui()
-        self.load_accounts()
+        # 调度器和适配器会连带加载 Playwright 等较重的模块，在后台线程导入完成后再加载账号
+        QThreadPool.globalInstance().start(
+            PreloadModulesRunnable(self._modules_preloaded_signal)
+        )
     
+    def _close_browser_on_quit(self):
+        """程序退出时关闭所有浏览器资源"""
+        from src.browser.browser_manager import browser_manager
+
+        try:
+            event_loop_thread.submit(browser_manager.close_all()).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"退出时关闭浏览器失败: {e}")
+
     def init_ui(self):
         """初始化界面"""
         self.setWindowTitle("内容自动发布系统 v0.2")
@@ -177,6 +386,13 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
+
+        # 进度条最多约 30 次/秒刷新，收到进度信号时才启动，合并期间的多次进度
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._apply_progress)
     
     def _create_toolbar(self) -> QHBoxLayout:
         """创建工具栏"""
@@ -225,6 +441,7 @@ class MainWindow(QMainWindow):
         self.account_table.setColumnWidth(0, 50)
         self.account_table.setColumnWidth(2, 80)
         self.account_table.setColumnWidth(3, 100)
+        self.account_table.setStyleSheet(_LOGIN_BTN_QSS)
 
         # 启用拖拽排序
         self.account_table.setDragEnabled(True)
@@ -271,10 +488,6 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(add_btn_layout)
 
-        # 保留旧的list用于兼容
-        self.account_list = QListWidget()
-        self.account_list.setVisible(False)
-
         return group
     
     def _create_task_panel(self) -> QGroupBox:
@@ -282,21 +495,39 @@ class MainWindow(QMainWindow):
         group = QGroupBox("发布配置")
         layout = QVBoxLayout(group)
 
-        # 发布模式提示
-        mode_label = QLabel("📝 串行发布模式（逐个账号依次执行）")
-        mode_label.setStyleSheet("color: #666; font-style: italic;")
-        layout.addWidget(mode_label)
-
-        # 任务配置表格
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(3)
-        self.task_table.setHorizontalHeaderLabels(["账号", "发布数量", "状态"])
+        # 发布模式：同时执行的账号数量（每个账号使用独立的浏览器上下文）
+        mode_layout = QHBoxLayout()
+        mode_layout.addWidget(QLabel("同时发布账号数:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 10)
+        self.concurrency_spin.setValue(1)
+        self.concurrency_spin.valueChanged.connect(self._update_mode_label)
+        mode_layout.addWidget(self.concurrency_spin)
+        self.mode_label = QLabel()
+        self.mode_label.setStyleSheet("color: #666; font-style: italic;")
+        mode_layout.addWidget(self.mode_label, 1)
+        layout.addLayout(mode_layout)
+        self._update_mode_label(self.concurrency_spin.value())
+
+        # 任务配置表格（发布数量列点击即可编辑）
+        self._task_model = TaskTableModel(self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self._task_model)
+        self.task_table.setItemDelegateForColumn(
+            TaskTableModel.COUNT_COLUMN, PublishCountDelegate(self.task_table)
+        )
+        self.task_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.task_table)
 
         return group
 
-
+    def _update_mode_label(self, count: int):
+        """根据并发数更新发布模式提示"""
+        if count <= 1:
+            self.mode_label.setText("📝 串行发布模式（逐个账号依次执行）")
+        else:
+            self.mode_label.setText(f"📝 并行发布模式（同时执行 {count} 个账号）")
 
     def _create_content_panel(self) -> QGroupBox:
         """创建内容预览面板"""
@@ -308,7 +539,12 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.article_count_label)
 
         # 文章列表
-        self.article_list = QListWidget()
+        # 只读文本列表，用 QStringListModel 存储，不为每篇文章创建 QListWidgetItem
+        self._article_model = QStringListModel(self)
+        self.article_list = QListView()
+        self.article_list.setModel(self._article_model)
+        self.article_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.article_list.setUniformItemSizes(True)  # 单行文本，行高一致，跳过逐行尺寸计算
         layout.addWidget(self.article_list)
 
         return group
@@ -322,40 +558,65 @@ class MainWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
+        # 只保留最近的日志行，避免长时间运行后文档无限增长
+        self.log_text.document().setMaximumBlockCount(_LOG_MAX_LINES)
         layout.addWidget(self.log_text)
 
+        # 日志缓冲：50ms 内的多条日志合并为一次追加和重绘
+        # 超出面板行数上限的旧日志无论如何都会被丢弃，缓冲区同样限长
+        self._log_buffer: deque[str] = deque(maxlen=_LOG_MAX_LINES)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         return group
 
     def load_accounts(self):
         """加载账号列表"""
+        from src.core.scheduler import scheduler
+
         accounts = scheduler.load_accounts()
-        self.account_table.setRowCount(len(accounts))
-        self.task_table.setRowCount(len(accounts))
+        self._task_model.set_accounts(accounts)
+
+        with self._batch_update(self.account_table):
+            self.account_table.setRowCount(len(accounts))
+            self._account_rows.clear()
 
-        for i, acc in enumerate(accounts):
-            self._add_account_row(i, acc)
+            for i, acc in enumerate(accounts):
+                self._add_account_row(i, acc)
 
         self.log("已加载 {} 个账号".format(len(accounts)))
 
+    @staticmethod
+    @contextmanager
+    def _batch_update(table: QTableWidget):
+        """批量修改表格：期间暂停重绘并屏蔽信号，结束后统一刷新一次"""
+        table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(table)
+        try:
+            yield
+        finally:
+            blocker.unblock()
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
     def _add_account_row(self, row: int, acc):
-        """添加账号行到表格
+        """添加账号行到账号表格（发布配置表由 TaskTableModel 单独维护）
 
         Args:
             row: 行号
             acc: AccountTask对象
         """
+        self._account_rows[acc.account_id] = row
+
         # 添加到账号表格
-        # 选择框
-        checkbox = QCheckBox()
-        checkbox.setChecked(acc.enabled)
-        checkbox.setProperty("account_id", acc.account_id)
-        checkbox.stateChanged.connect(self.on_account_checkbox_changed)
-        checkbox_widget = QWidget()
-        checkbox_layout = QHBoxLayout(checkbox_widget)
-        checkbox_layout.addWidget(checkbox)
-        checkbox_layout.setAlignment(Qt.AlignCenter)
-        checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        self.account_table.setCellWidget(row, 0, checkbox_widget)
+        # 选择框（使用单元格自带的勾选状态，状态变化经 cellChanged 处理）
+        check_item = QTableWidgetItem()
+        check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        check_item.setCheckState(Qt.Checked if acc.enabled else Qt.Unchecked)
+        check_item.setData(Qt.UserRole, acc.account_id)
+        self.account_table.setItem(row, 0, check_item)
 
         # 账号名称
         name_item = QTableWidgetItem(acc.account_name)
@@ -398,30 +659,17 @@ class MainWindow(QMainWindow):
 
         self.account_table.setCellWidget(row, 3, ops_widget)
 
-        # 添加到任务配置表
-        task_name_item = QTableWidgetItem(acc.account_name)
-        task_name_item.setData(Qt.UserRole, acc.account_id)
-        self.task_table.setItem(row, 0, task_name_item)
-
-        spin = QSpinBox()
-        spin.setRange(0, 100)
-        spin.setValue(0)
-        spin.setProperty("account_id", acc.account_id)
-        spin.valueChanged.connect(self.on_count_changed)
-        self.task_table.setCellWidget(row, 1, spin)
+    def on_account_checkbox_changed(self, row: int):
+        """账号勾选状态变化"""
+        from src.core.scheduler import scheduler
 
-        self.task_table.setItem(row, 2, QTableWidgetItem("待配置"))
-
-    def on_account_checkbox_changed(self, state):
-        """账号复选框状态变化"""
-        checkbox = self.sender()
-        account_id = checkbox.property("account_id")
-        enabled = state == Qt.Checked.value
+        item = self.account_table.item(row, 0)
+        if not item:
+            return
 
-        for acc in scheduler.account_tasks:
-            if acc.account_id == account_id:
-                acc.enabled = enabled
-                break
+        acc = scheduler.get_account(item.data(Qt.UserRole))
+        if acc:
+            acc.enabled = item.checkState() == Qt.Checked
 
     def on_add_account_clicked(self, platform: str):
         """点击添加账号按钮
@@ -429,23 +677,23 @@ class MainWindow(QMainWindow):
         Args:
             platform: 平台名称 ('toutiao', 'sohu' 或 'baijiahao')
         """
-        platform_names = {
-            "toutiao": "今日头条",
-            "sohu": "搜狐",
-            "baijiahao": "百家号"
-        }
-        platform_name = platform_names.get(platform, platform)
+        from src.core.scheduler import scheduler
+        from src.utils.config import PLATFORM_NAMES
+
+        platform_name = PLATFORM_NAMES.get(platform, platform)
 
         # 调用scheduler添加账号
         new_acc = scheduler.add_account(platform)
 
-        # 添加到账号表格
+        # 添加到账号表格（setItem 会触发 cellChanged，填充期间屏蔽信号，
+        # 避免 on_account_cell_changed 把新账号名称再写一遍配置文件）
         row = self.account_table.rowCount()
-        self.account_table.insertRow(row)
-        self.task_table.insertRow(row)
+        with self._batch_update(self.account_table):
+            self.account_table.insertRow(row)
 
-        # 使用统一的方法添加行
-        self._add_account_row(row, new_acc)
+            # 使用统一的方法添加行
+            self._add_account_row(row, new_acc)
+        self._task_model.append_account(new_acc)
 
         self.log(f"✅ 已添加新账号: {new_acc.account_name}")
 
@@ -468,36 +716,39 @@ class MainWindow(QMainWindow):
         btn.setText("登录中...")
         btn.setEnabled(False)
 
-        # 保存按钮引用用于后续更新
-        self._current_login_btn = btn
+        # 启动时已在后台线程预加载，这里的导入只是字典查找
+        from src.core.scheduler import ADAPTER_CLASSES
 
-        # 使用工作线程进行登录
-        self._login_worker = AsyncWorker(
-            task_type="login",
-            account_id=account_id,
-            account_name=account_name,
-            platform=platform,
-            profile_dir=profile_dir
-        )
-        self._login_worker.finished.connect(self._on_login_worker_finished)
-        self._login_worker.error.connect(lambda e: self._login_finished_signal.emit(False, ""))
-        self._login_worker.start()
+        adapter_class = ADAPTER_CLASSES.get(platform, ADAPTER_CLASSES['sohu'])
+        adapter = adapter_class(account_id, profile_dir, account_name)
+
+        # 直接提交到后台 event loop，不再为每次登录启动工作线程；
+        # 结果按 account_id 回传。多个账号同时登录时，浏览器只由
+        # BrowserManager.initialize() 在初始化锁内启动一次，各账号使用各自的上下文
+        future = event_loop_thread.submit(_login(adapter, account_id))
+        future.add_done_callback(lambda f: self._on_login_future_done(account_id, f))
 
-    def _on_login_worker_finished(self):
-        """登录工作线程完成"""
-        success = getattr(self._login_worker, '_kwargs', {}).get('success', False)
-        nickname = getattr(self._login_worker, '_kwargs', {}).get('nickname', "")
-        self._login_finished_signal.emit(success, nickname)
+    def _on_login_future_done(self, account_id: str, future):
+        """登录协程结束（在 event loop 线程中调用，只负责发出信号）"""
+        error = self._future_error(future)
+        if error:
+            result = LoginResult(account_id, False, error=error)
+        else:
+            result = future.result()
+        self._login_finished_signal.emit(result)
 
-    def _on_login_finished(self, success: bool, nickname: str):
+    def _on_login_finished(self, result: LoginResult):
         """登录完成回调（在主线程中执行）"""
-        btn = getattr(self, '_current_login_btn', None)
-        if btn:
-            account_id = btn.property("account_id")
+        if result.error:
+            self.log(f"登录出错: {result.error}")
 
-            if success:
+        account_id, nickname = result.account_id, result.nickname
+        row = self._account_rows.get(account_id)
+        btn = self.account_table.cellWidget(row, 2) if row is not None else None
+        if btn:
+            if result.success:
                 btn.setText("已登录 ✓")
-                btn.setStyleSheet("background-color: #4CAF50; color: white;")
+                self._set_logged_in_style(btn, True)
 
                 # 如果获取到昵称，更新显示
                 if nickname:
@@ -507,53 +758,43 @@ class MainWindow(QMainWindow):
                     self.log("登录成功！")
             else:
                 btn.setText("登录")
-                btn.setStyleSheet("")
+                self._set_logged_in_style(btn, False)
                 self.log("登录失败或超时")
             btn.setEnabled(True)
 
+    @staticmethod
+    def _set_logged_in_style(btn: QPushButton, logged_in: bool):
+        """切换登录按钮的已登录样式（由账号表格的样式表按属性匹配）"""
+        btn.setProperty("loggedIn", logged_in)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
+
     def _update_account_nickname(self, account_id: str, nickname: str):
         """更新账号昵称显示和配置"""
-        from src.utils.config import config
+        from src.core.scheduler import scheduler
+        from src.utils.config import config, PLATFORM_NAMES
+
+        acc = scheduler.get_account(account_id)
+        if acc is None:
+            return
+
+        # 组合新名称：平台-昵称
+        new_name = f"{PLATFORM_NAMES.get(acc.platform, acc.platform)}-{nickname}"
 
         # 更新账号表格中的显示
-        for row in range(self.account_table.rowCount()):
-            name_item = self.account_table.item(row, 1)
-            if name_item and name_item.data(Qt.UserRole) == account_id:
-                # 获取平台前缀
-                platform = ""
-                for acc in scheduler.account_tasks:
-                    if acc.account_id == account_id:
-                        platform = acc.platform
-                        break
-
-                # 组合新名称：平台-昵称
-                platform_prefix = "今日头条" if platform == "toutiao" else "搜狐"
-                new_name = f"{platform_prefix}-{nickname}"
+        row = self._account_rows.get(account_id)
+        name_item = self.account_table.item(row, 1) if row is not None else None
+        if name_item:
+            # 程序修改名称不应触发 on_account_cell_changed 再保存一次配置
+            with QSignalBlocker(self.account_table):
                 name_item.setText(new_name)
-                break
-
-        # 更新任务配置表格中的显示
-        for row in range(self.task_table.rowCount()):
-            task_item = self.task_table.item(row, 0)
-            if task_item and task_item.data(Qt.UserRole) == account_id:
-                platform = ""
-                for acc in scheduler.account_tasks:
-                    if acc.account_id == account_id:
-                        platform = acc.platform
-                        break
-                platform_prefix = "今日头条" if platform == "toutiao" else "搜狐"
-                new_name = f"{platform_prefix}-{nickname}"
-                task_item.setText(new_name)
-                break
-
-        # 更新scheduler中的账号名称
-        for acc in scheduler.account_tasks:
-            if acc.account_id == account_id:
-                platform_prefix = "今日头条" if acc.platform == "toutiao" else "搜狐"
-                acc.account_name = f"{platform_prefix}-{nickname}"
-                break
 
-        # 保存到配置文件
+        # 更新scheduler中的账号名称（任务配置表直接读取该名称）
+        acc.account_name = new_name
+        self._task_model.refresh_account(account_id)
+
+        # 保存到配置文件（登录获取的昵称覆盖尚未保存的手动修改）
+        self._pending_names.pop(account_id, None)
         config.update_account_nickname(account_id, nickname)
 
     def import_excel(self):
@@ -563,28 +804,37 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            if scheduler.load_articles(file_path):
-                self.file_label.setText(file_path)
-                articles = scheduler.get_articles()
-                self.article_count_label.setText(f"已导入: {len(articles)} 篇文章")
+            # 在线程池中解析文件，解析完成前禁止重复导入和开始发布
+            self.import_btn.setEnabled(False)
+            self.start_btn.setEnabled(False)
+            self.file_label.setText(f"正在读取: {file_path}")
+            QThreadPool.globalInstance().start(
+                LoadArticlesRunnable(file_path, self._articles_loaded_signal)
+            )
 
-                # 显示文章列表
-                self.article_list.clear()
-                for article in articles:
-                    self.article_list.addItem(f"{article.index}. {article.title}")
+    def _on_articles_loaded(self, file_path: str, success: bool, labels: list):
+        """文章读取完成回调（在主线程中执行）"""
+        from src.core.scheduler import scheduler
 
-                self.log(f"成功导入 {len(articles)} 篇文章")
-            else:
-                QMessageBox.warning(self, "导入失败", "无法读取Excel文件")
+        self.import_btn.setEnabled(True)
+        self.start_btn.setEnabled(not scheduler.is_running)
 
-    def on_count_changed(self, value: int):
-        """发布数量变化"""
-        spin = self.sender()
-        account_id = spin.property("account_id")
-        scheduler.set_account_publish_count(account_id, value)
+        if success:
+            self.file_label.setText(file_path)
+            self.article_count_label.setText(f"已导入: {len(labels)} 篇文章")
+
+            # 显示文章列表（整体替换，只触发一次模型重置）
+            self._article_model.setStringList(labels)
+
+            self.log(f"成功导入 {len(labels)} 篇文章")
+        else:
+            self.file_label.setText("未选择文件")
+            QMessageBox.warning(self, "导入失败", "无法读取Excel文件")
 
     def start_publish(self):
         """开始发布"""
+        from src.core.scheduler import scheduler
+
         # 检查是否已导入文章
         if not scheduler.get_articles():
             QMessageBox.warning(self, "提示", "请先导入Excel文件")
@@ -598,97 +848,147 @@ class MainWindow(QMainWindow):
 
         # 重置scheduler状态（清除之前的取消标志和适配器）
         scheduler.reset()
+        scheduler.set_max_concurrent(self.concurrency_spin.value())
+        self._stop_requested = False
 
         # 更新UI
         self.start_btn.setEnabled(False)
+        self.concurrency_spin.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(len(tasks))
         self.progress_bar.setValue(0)
+        self._pending_progress = None
+        self._task_model.begin_run(tasks)
 
         self.log(f"开始执行 {len(tasks)} 个发布任务...")
 
-        # 启动工作线程
-        self.worker = AsyncWorker()
-        self.worker.log_message.connect(self.log)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
-        self.worker.start()
+        # 直接提交到后台 event loop，与登录、打开浏览器相同，不再单独启动工作线程
+        scheduler.on_log = self._publish_log_signal.emit
+        scheduler.on_progress = self._publish_progress_signal.emit
+        scheduler.on_task_complete = self._task_updated_signal.emit
+        self._publish_future = event_loop_thread.submit(scheduler.run())
+        self._publish_future.add_done_callback(
+            lambda f: self._publish_finished_signal.emit(self._future_error(f))
+        )
 
     def stop_publish(self):
-        """停止发布：尽量做到快速且优雅地终止当前任务"""
+        """停止发布：尽量做到快速且优雅地终止当前任务
+
+        只发出取消请求，不在主线程中等待；scheduler.run() 结束后由
+        _on_publish_finished 恢复控件，并在那时关闭浏览器上下文。
+        """
+        from src.core.scheduler import scheduler
+
+        self.stop_btn.setEnabled(False)
+        self._stop_requested = True
+        if self._publish_future is None:
+            self.on_finished()
+            return
+
         self.log("正在停止...")
         # 通知调度器和各适配器设置取消标志
         scheduler.cancel()
 
-        # 优先尝试在工作线程自己的事件循环中关闭浏览器，避免跨事件循环错误
-        if hasattr(self, 'worker') and self.worker is not None:
-            from src.browser.browser_manager import browser_manager
-            try:
-                import asyncio
-                worker_loop = getattr(self.worker, "_loop", None)
-                if worker_loop is not None and not worker_loop.is_closed():
-                    # 在工作线程的事件循环中调度 close_all
-                    future = asyncio.run_coroutine_threadsafe(
-                        browser_manager.close_all(), worker_loop
-                    )
-                    try:
-                        # 最多等待 5 秒关闭浏览器
-                        future.result(timeout=5)
-                    except Exception as e:  # pragma: no cover - 防御性日志
-                        self.log(f"等待浏览器关闭时出错: {e}")
-                else:
-                    # 退化方案：当前拿不到有效事件循环时，使用临时事件循环关闭
-                    loop = asyncio.new_event_loop()
-                    try:
-                        loop.run_until_complete(browser_manager.close_all())
-                    finally:
-                        loop.close()
-            except Exception as e:  # pragma: no cover - 防御性日志
-                self.log(f"关闭浏览器时出错: {e}")
-
-            # 等待工作线程优雅退出，如果 2 秒内仍未退出再强制终止
-            if self.worker.isRunning():
-                if not self.worker.wait(2000):
-                    self.worker.terminate()
-                    self.worker.wait(2000)
-
-        # 更新UI状态
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.log("已停止")
+    def _close_contexts_after_stop(self):
+        """手动停止后关闭页面和上下文（保留浏览器供下次复用）
+
+        必须在调度器结束后调用，避免 worker 仍在等待的页面被提前关闭。
+        """
+        from src.browser.browser_manager import browser_manager
+
+        # 出错时排队到主线程记录日志
+        event_loop_thread.submit(browser_manager.close_contexts_only()).add_done_callback(
+            lambda f: self._stop_error_signal.emit(self._future_error(f))
+        )
+
+    def _on_stop_error(self, error: str):
+        """停止后关闭浏览器上下文完成（在主线程中执行）"""
+        if error:
+            self.log(f"关闭浏览器时出错: {error}")
 
     def on_progress(self, current: int, total: int):
-        """进度更新"""
-        self.progress_bar.setValue(current)
+        """进度更新（只记录最新值，由定时器统一刷新）"""
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_progress(self):
+        """将最新进度写入进度条"""
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
+        if total != self.progress_bar.maximum():
+            self.progress_bar.setMaximum(total)
+        if current != self.progress_bar.value():
+            self.progress_bar.setValue(current)
+
+    def _stop_progress_timer(self):
+        """停止进度刷新定时器，并写入最后一次进度"""
+        self._progress_timer.stop()
+        self._apply_progress()
+
+    def _on_task_updated(self, task):
+        """单个发布任务结束（在主线程中执行）"""
+        self._task_model.task_finished(task)
+
+    def _on_publish_finished(self, error: str):
+        """scheduler.run() 结束（在主线程中执行）"""
+        self._publish_future = None
+        self._task_model.end_run()
+        if error:
+            self.on_error(error)
+        else:
+            self.on_finished()
 
     def on_finished(self):
         """任务完成"""
+        self._stop_progress_timer()
         self.start_btn.setEnabled(True)
+        self.concurrency_spin.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        if self._stop_requested:
+            # 手动停止的任务不弹出完成提示
+            self._stop_requested = False
+            self._close_contexts_after_stop()
+            self.log("已停止")
+            return
         self.log("所有任务已完成!")
         QMessageBox.information(self, "完成", "发布任务已完成!")
 
     def on_error(self, error: str):
         """任务出错"""
+        if self._stop_requested:
+            self._stop_requested = False
+            self._close_contexts_after_stop()
+        self._stop_progress_timer()
         self.start_btn.setEnabled(True)
+        self.concurrency_spin.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.log(f"错误: {error}")
         QMessageBox.critical(self, "错误", error)
 
     def log(self, message: str):
         """添加日志"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-        # 滚动到底部
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        self._log_buffer.append(f"[{strftime('%H:%M:%S')}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """将缓冲的日志一次性写入日志面板"""
+        if not self._log_buffer:
+            return
+        self.log_text.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        # 光标移到末尾即可滚动到底部，无需查询滚动条范围
+        self.log_text.moveCursor(QTextCursor.End)
+        self.log_text.ensureCursorVisible()
 
     def on_delete_account_clicked(self):
         """点击删除账号按钮"""
+        from src.core.scheduler import scheduler
+
         btn = self.sender()
         account_id = btn.property("account_id")
         account_name = btn.property("account_name")
@@ -715,18 +1015,16 @@ class MainWindow(QMainWindow):
 
         if success:
             # 从表格中移除对应行
-            for row in range(self.account_table.rowCount()):
-                name_item = self.account_table.item(row, 1)
-                if name_item and name_item.data(Qt.UserRole) == account_id:
-                    self.account_table.removeRow(row)
-                    break
+            row = self._account_rows.pop(account_id, None)
+            if row is not None:
+                self.account_table.removeRow(row)
+                # 删除行之后的行号前移一位
+                self._account_rows = {
+                    aid: r - 1 if r > row else r for aid, r in self._account_rows.items()
+                }
 
             # 从任务配置表中移除
-            for row in range(self.task_table.rowCount()):
-                task_item = self.task_table.item(row, 0)
-                if task_item and task_item.data(Qt.UserRole) == account_id:
-                    self.task_table.removeRow(row)
-                    break
+            self._task_model.remove_account(account_id)
 
             self.log(f"🗑️ 已删除账号: {account_name}")
         else:
@@ -749,32 +1047,49 @@ class MainWindow(QMainWindow):
 
         self.log(f"🌐 正在打开浏览器: {account_id}")
 
-        # 使用工作线程打开浏览器
-        self._open_browser_worker = AsyncWorker(
-            task_type="open_browser",
-            account_id=account_id,
-            platform=platform,
-            profile_dir=profile_dir,
-            start_url=start_url
-        )
-        self._open_browser_worker.finished.connect(
-            lambda: self.log(f"✅ 浏览器已打开: {account_id}")
+        from src.browser.browser_manager import browser_manager
+
+        # 直接提交到后台 event loop，完成后通过信号回到主线程，不再为此启动工作线程
+        future = event_loop_thread.submit(
+            browser_manager.open_standalone_browser(account_id, profile_dir, start_url)
         )
-        self._open_browser_worker.error.connect(
-            lambda e: self.log(f"❌ 打开浏览器失败: {e}")
+        future.add_done_callback(
+            lambda f: self._browser_opened_signal.emit(account_id, self._future_error(f))
         )
-        self._open_browser_worker.start()
+
+    @staticmethod
+    def _future_error(future) -> str:
+        """返回 Future 的错误信息，成功时返回空字符串（在 event loop 线程中调用）"""
+        if future.cancelled():
+            return "已取消"
+        error = future.exception()
+        return str(error) if error else ""
+
+    def _on_browser_opened(self, account_id: str, error: str):
+        """独立浏览器打开完成（在主线程中执行）"""
+        if error:
+            self.log(f"❌ 打开浏览器失败: {error}")
+        else:
+            self.log(f"✅ 浏览器已打开: {account_id}")
 
     def on_account_cell_double_clicked(self, row: int, column: int):
         """双击账号单元格 - 只有账号名称列可编辑"""
         if column == 1:  # 账号名称列
             item = self.account_table.item(row, column)
             if item:
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
+                # setFlags 同样会发出 cellChanged，屏蔽掉避免无意义的保存
+                with QSignalBlocker(self.account_table):
+                    item.setFlags(item.flags() | Qt.ItemIsEditable)
                 self.account_table.editItem(item)
 
     def on_account_cell_changed(self, row: int, column: int):
-        """账号单元格内容变化 - 保存修改的昵称"""
+        """账号单元格内容变化 - 勾选状态或修改的昵称"""
+        from src.core.scheduler import scheduler
+
+        if column == 0:  # 选择列
+            self.on_account_checkbox_changed(row)
+            return
+
         if column != 1:  # 只处理账号名称列
             return
 
@@ -788,27 +1103,45 @@ class MainWindow(QMainWindow):
         if not account_id or not new_name:
             return
 
-        # 更新scheduler中的账号名称
-        for acc in scheduler.account_tasks:
-            if acc.account_id == account_id:
-                acc.account_name = new_name
-                break
+        # 更新scheduler中的账号名称（名称未变化时不做任何事）
+        acc = scheduler.get_account(account_id)
+        if acc:
+            if acc.account_name == new_name:
+                return
+            acc.account_name = new_name
 
         # 更新任务配置表中的显示
-        for task_row in range(self.task_table.rowCount()):
-            task_item = self.task_table.item(task_row, 0)
-            if task_item and task_item.data(Qt.UserRole) == account_id:
-                task_item.setText(new_name)
-                break
+        self._task_model.refresh_account(account_id)
 
-        # 保存到配置文件
-        from src.utils.config import config
-        config.update_account_name(account_id, new_name)
+        # 延迟保存到配置文件（连续修改多个账号时只写一次）
+        self._pending_names[account_id] = new_name
+        self._name_save_timer.start()
 
         self.log(f"✏️ 账号昵称已修改: {new_name}")
 
+    def _flush_pending_names(self):
+        """将暂存的账号名称写入配置文件"""
+        if not self._pending_names:
+            return
+
+        from src.utils.config import config
+
+        self._name_save_timer.stop()
+        with config.batch():
+            for account_id, new_name in self._pending_names.items():
+                config.update_account_name(account_id, new_name)
+        self._pending_names.clear()
+
     def on_account_row_moved(self, logical_index: int, old_visual_index: int, new_visual_index: int):
-        """账号行拖拽移动后 - 保存新顺序"""
+        """账号行拖拽移动后 - 连续的移动合并为一次，稍后统一保存新顺序"""
+        self._reorder_timer.start()
+
+    def _commit_account_order(self):
+        """按账号表格当前的显示顺序同步调度器、任务配置表和配置文件"""
+        from src.core.scheduler import scheduler
+
+        self._reorder_timer.stop()
+
         # 获取当前视觉顺序对应的账号ID列表
         new_order = []
         for visual_row in range(self.account_table.rowCount()):
@@ -829,44 +1162,13 @@ class MainWindow(QMainWindow):
         from src.utils.config import config
         config.reorder_accounts(new_order)
 
-        self.log(f"📋 账号顺序已更新")
+        self.log("📋 账号顺序已更新")
+
+    def _flush_pending_order(self):
+        """如果还有未保存的排序，立即保存"""
+        if self._reorder_timer.isActive():
+            self._commit_account_order()
 
     def _sync_task_table_order(self, new_order: list):
         """同步任务配置表的顺序"""
-        # 保存当前任务表的数据
-        task_data = {}
-        for row in range(self.task_table.rowCount()):
-            task_item = self.task_table.item(row, 0)
-            if task_item:
-                account_id = task_item.data(Qt.UserRole)
-                spin_widget = self.task_table.cellWidget(row, 1)
-                count = spin_widget.value() if spin_widget else 0
-                status_item = self.task_table.item(row, 2)
-                status = status_item.text() if status_item else "待配置"
-                task_data[account_id] = {
-                    'name': task_item.text(),
-                    'count': count,
-                    'status': status
-                }
-
-        # 按新顺序重建任务表
-        self.task_table.setRowCount(len(new_order))
-        for row, account_id in enumerate(new_order):
-            if account_id in task_data:
-                data = task_data[account_id]
-
-                # 账号名称
-                task_name_item = QTableWidgetItem(data['name'])
-                task_name_item.setData(Qt.UserRole, account_id)
-                self.task_table.setItem(row, 0, task_name_item)
-
-                # 发布数量
-                spin = QSpinBox()
-                spin.setRange(0, 100)
-                spin.setValue(data['count'])
-                spin.setProperty("account_id", account_id)
-                spin.valueChanged.connect(self.on_count_changed)
-                self.task_table.setCellWidget(row, 1, spin)
-
-                # 状态
-                self.task_table.setItem(row, 2, QTableWidgetItem(data['status']))
+        self._task_model.reorder(new_order)
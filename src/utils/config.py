@@ -4,7 +4,15 @@
 
 import os
 import json
-from typing import Dict, List, Any
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional
+
+# 可选依赖：安装 orjson 后用它读写 accounts.json，速度更快
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 项目根目录 - 使用main.py所在目录
 # config.py 在 src/utils/ 下，往上2层到达项目根目录
@@ -16,9 +24,19 @@ ROOT_DIR = os.path.dirname(_src_dir)          # 项目根目录
 DATA_DIR = os.path.join(ROOT_DIR, 'data')
 BROWSER_PROFILES_DIR = os.path.join(DATA_DIR, 'browser_profiles')
 
-# 确保目录存在
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(BROWSER_PROFILES_DIR, exist_ok=True)
+# 平台 -> 显示名称（账号名称前缀），界面与配置共用这一份
+PLATFORM_NAMES = {"toutiao": "今日头条", "sohu": "搜狐", "baijiahao": "百家号"}
+
+# 数据目录在首次写入时才创建，导入本模块不访问磁盘
+_dirs_ensured = False
+
+
+def _ensure_data_dirs():
+    """确保数据目录存在（进程内只创建一次）"""
+    global _dirs_ensured
+    if not _dirs_ensured:
+        os.makedirs(BROWSER_PROFILES_DIR, exist_ok=True)  # 会一并创建 DATA_DIR
+        _dirs_ensured = True
 
 
 class Config:
@@ -26,42 +44,120 @@ class Config:
     
     def __init__(self):
         self.accounts_file = os.path.join(DATA_DIR, 'accounts.json')
-        self._accounts = self._load_accounts()
+
+        # 账号列表在首次访问时才从文件加载，导入本模块不读取磁盘
+        self._accounts_cache: Optional[List[Dict[str, Any]]] = None
+        self._index_cache: Dict[str, Dict[str, Any]] = {}  # 账号ID -> 账号信息
+        self._platform_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None  # 平台 -> 账号列表（首次按平台查询时建立）
+
+        # 批量修改时延迟保存
+        self._dirty = False
+        self._batch_depth = 0
+
+        # 已确认存在的目录，避免重复调用 os.makedirs
+        self._ensured_dirs: set[str] = set()
+
+    @property
+    def _accounts(self) -> List[Dict[str, Any]]:
+        """账号列表（首次访问时加载）"""
+        if self._accounts_cache is None:
+            self._accounts_cache = self._load_accounts()
+            self._index_cache = {acc['id']: acc for acc in self._accounts_cache}
+        return self._accounts_cache
+
+    @_accounts.setter
+    def _accounts(self, accounts: List[Dict[str, Any]]):
+        self._accounts_cache = accounts
+        self._platform_cache = None  # 列表被替换（删除、排序）后按需重建
+
+    @property
+    def _id_index(self) -> Dict[str, Dict[str, Any]]:
+        """账号ID索引（与账号列表一起加载）"""
+        if self._accounts_cache is None:
+            self._accounts  # 触发加载
+        return self._index_cache
     
     def _load_accounts(self) -> List[Dict[str, Any]]:
         """加载账号配置"""
         if os.path.exists(self.accounts_file):
-            with open(self.accounts_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('accounts', [])
+            with open(self.accounts_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw.decode('utf-8'))
+            return data.get('accounts', [])
         return []
     
     def save_accounts(self):
-        """保存账号配置"""
-        with open(self.accounts_file, 'w', encoding='utf-8') as f:
-            json.dump({'accounts': self._accounts}, f, ensure_ascii=False, indent=4)
+        """保存账号配置
+
+        先在内存中序列化，一次写入临时文件后再原子替换，
+        写入过程中程序退出也不会留下半个 accounts.json。
+        """
+        payload = {'accounts': self._accounts}
+        if orjson:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+        _ensure_data_dirs()
+        tmp_file = self.accounts_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, self.accounts_file)
     
+    def _ensure_dir(self, path: str):
+        """确保目录存在（同一目录只创建一次）"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _mark_dirty(self):
+        """标记账号配置已修改；不在批量修改中时立即保存"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.save_accounts()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """批量修改账号配置，退出时只保存一次
+
+        用法:
+            with config.batch():
+                config.update_account_name(...)
+                config.update_account_name(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save_accounts()
+                self._dirty = False
+
     def get_accounts(self) -> List[Dict[str, Any]]:
         """获取所有账号"""
         return self._accounts
     
     def get_accounts_by_platform(self, platform: str) -> List[Dict[str, Any]]:
         """按平台获取账号"""
-        return [acc for acc in self._accounts if acc['platform'] == platform]
+        if self._platform_cache is None:
+            by_platform = defaultdict(list)
+            for acc in self._accounts:
+                by_platform[acc['platform']].append(acc)
+            self._platform_cache = dict(by_platform)
+        # 返回副本，调用方修改结果不会破坏索引
+        return list(self._platform_cache.get(platform, ()))
     
     def get_account_by_id(self, account_id: str) -> Dict[str, Any] | None:
         """根据ID获取账号"""
-        for acc in self._accounts:
-            if acc['id'] == account_id:
-                return acc
-        return None
+        return self._id_index.get(account_id)
     
     def get_profile_dir(self, account_id: str) -> str:
         """获取账号的浏览器配置文件目录"""
         account = self.get_account_by_id(account_id)
         if account:
             profile_dir = os.path.join(BROWSER_PROFILES_DIR, account['profile_dir'])
-            os.makedirs(profile_dir, exist_ok=True)
+            self._ensure_dir(profile_dir)
             return profile_dir
         return ""
 
@@ -72,20 +168,18 @@ class Config:
             account_id: 账号ID
             nickname: 新昵称
         """
-        for acc in self._accounts:
-            if acc['id'] == account_id:
-                # 获取平台前缀
-                platform = acc.get('platform', '')
-                platform_prefixes = {"toutiao": "今日头条", "sohu": "搜狐", "baijiahao": "百家号"}
-                platform_prefix = platform_prefixes.get(platform, platform)
+        acc = self._id_index.get(account_id)
+        if acc:
+            # 获取平台前缀
+            platform = acc.get('platform', '')
+            platform_prefix = PLATFORM_NAMES.get(platform, platform)
 
-                # 更新名称
-                acc['name'] = f"{platform_prefix}-{nickname}"
-                acc['nickname'] = nickname  # 保存原始昵称
+            # 更新名称
+            acc['name'] = f"{platform_prefix}-{nickname}"
+            acc['nickname'] = nickname  # 保存原始昵称
 
-                # 保存到文件
-                self.save_accounts()
-                break
+            # 保存到文件
+            self._mark_dirty()
 
     def update_account_name(self, account_id: str, new_name: str):
         """更新账号显示名称（用户手动修改的完整名称）
@@ -94,11 +188,10 @@ class Config:
             account_id: 账号ID
             new_name: 新的完整显示名称
         """
-        for acc in self._accounts:
-            if acc['id'] == account_id:
-                acc['name'] = new_name
-                self.save_accounts()
-                break
+        acc = self._id_index.get(account_id)
+        if acc:
+            acc['name'] = new_name
+            self._mark_dirty()
 
     def reorder_accounts(self, new_order: list):
         """重新排序账号列表
@@ -106,8 +199,8 @@ class Config:
         Args:
             new_order: 账号ID的新顺序列表
         """
-        # 创建ID到账号的映射
-        account_map = {acc['id']: acc for acc in self._accounts}
+        # ID到账号的映射（顺序变化不影响索引内容）
+        account_map = self._id_index
 
         # 按新顺序重建列表
         reordered = []
@@ -116,12 +209,13 @@ class Config:
                 reordered.append(account_map[account_id])
 
         # 添加不在新顺序中的账号（防止丢失）
+        ordered_ids = set(new_order)
         for acc in self._accounts:
-            if acc['id'] not in new_order:
+            if acc['id'] not in ordered_ids:
                 reordered.append(acc)
 
         self._accounts = reordered
-        self.save_accounts()
+        self._mark_dirty()
 
     def add_account(self, platform: str) -> Dict[str, Any]:
         """添加新账号
@@ -132,29 +226,33 @@ class Config:
         Returns:
             新创建的账号信息字典
         """
-        # 计算该平台已有账号数量，生成新ID
-        platform_accounts = [acc for acc in self._accounts if acc['platform'] == platform]
-        new_index = len(platform_accounts) + 1
-
-        # 生成账号ID和目录名
-        account_id = f"{platform}_{new_index}"
-        profile_dir = f"{platform}_account{new_index}"
+        # 一次遍历收集该平台已占用的序号，生成新ID
+        id_prefix = f"{platform}_"
+        used = set()
+        platform_count = 0
+        for acc in self._accounts:
+            if acc['platform'] == platform:
+                platform_count += 1
+                suffix = acc['id'][len(id_prefix):] if acc['id'].startswith(id_prefix) else ''
+                if suffix.isdigit():
+                    used.add(int(suffix))
 
         # 确保ID不重复（防止删除后重新添加冲突）
-        existing_ids = {acc['id'] for acc in self._accounts}
-        while account_id in existing_ids:
+        new_index = platform_count + 1
+        while new_index in used:
             new_index += 1
-            account_id = f"{platform}_{new_index}"
-            profile_dir = f"{platform}_account{new_index}"
+
+        # 生成账号ID和目录名
+        account_id = f"{id_prefix}{new_index}"
+        profile_dir = f"{platform}_account{new_index}"
 
         # 生成账号名称
-        platform_prefixes = {"toutiao": "今日头条", "sohu": "搜狐", "baijiahao": "百家号"}
-        platform_prefix = platform_prefixes.get(platform, platform)
+        platform_prefix = PLATFORM_NAMES.get(platform, platform)
         account_name = f"{platform_prefix}-账号{new_index}"
 
         # 创建浏览器配置目录
         full_profile_dir = os.path.join(BROWSER_PROFILES_DIR, profile_dir)
-        os.makedirs(full_profile_dir, exist_ok=True)
+        self._ensure_dir(full_profile_dir)
 
         # 创建账号信息
         new_account = {
@@ -167,7 +265,10 @@ class Config:
 
         # 添加到列表并保存
         self._accounts.append(new_account)
-        self.save_accounts()
+        self._id_index[account_id] = new_account
+        if self._platform_cache is not None:
+            self._platform_cache.setdefault(platform, []).append(new_account)
+        self._mark_dirty()
 
         return new_account
 
@@ -189,12 +290,14 @@ class Config:
 
         # 从列表中移除
         self._accounts = [acc for acc in self._accounts if acc['id'] != account_id]
-        self.save_accounts()
+        self._id_index.pop(account_id, None)
+        self._mark_dirty()
 
         # 删除浏览器配置目录
         profile_dir = account.get('profile_dir', '')
         if profile_dir:
             full_profile_dir = os.path.join(BROWSER_PROFILES_DIR, profile_dir)
+            self._ensured_dirs.discard(full_profile_dir)
             if os.path.exists(full_profile_dir):
                 try:
                     shutil.rmtree(full_profile_dir)
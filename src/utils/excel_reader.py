@@ -4,16 +4,32 @@ Excel/CSV表格读取模块
 
 import os
 import csv
+import codecs
+import zipfile
+from datetime import date, datetime, time
+from itertools import islice
 from typing import List, Dict, Any
-from openpyxl import load_workbook
+from xml.etree import ElementTree
 from src.core.logger import get_logger
 
 logger = get_logger()
 
+# CSV 候选编码（按优先级）
+_CSV_ENCODINGS = ['utf-8', 'gbk', 'gb2312', 'utf-8-sig']
+
+# 检测编码时读取的文件头长度
+_ENCODING_SNIFF_SIZE = 64 * 1024
+
+# 读取CSV时的缓冲区大小（减少大文件的 read 调用次数）
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 class Article:
     """文章数据类"""
 
+    # 表格可能有上万行，使用 __slots__ 减少每篇文章的内存占用
+    __slots__ = ('index', 'title', 'content', 'published', 'publish_result')
+
     def __init__(self, index: int, title: str, content: str):
         self.index = index
         self.title = title
@@ -31,6 +47,12 @@ class ExcelReader:
     def __init__(self):
         self.articles: List[Article] = []
         self.file_path: str = ""
+        # 未发布的文章（有序字典当作有序集合用，按表格顺序，标记发布时 O(1) 移除）
+        self._unpublished: Dict[Article, None] = {}
+
+        # 上次成功解析的文件：(路径, 修改时间, 大小) 和 (序号, 标题, 内容) 列表
+        self._cache_key: tuple | None = None
+        self._cache_rows: List[tuple] = []
 
     def load(self, file_path: str) -> bool:
         """
@@ -49,18 +71,34 @@ class ExcelReader:
 
             self.file_path = file_path
             self.articles = []
+            self._unpublished = {}
+
+            # 文件未变化时直接用上次的解析结果重建文章（发布状态重新开始）
+            st = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+            if cache_key == self._cache_key:
+                self.articles = [Article(*row) for row in self._cache_rows]
+                self._unpublished = dict.fromkeys(self.articles)
+                logger.info(f"文件未变化，使用缓存的 {len(self.articles)} 篇文章")
+                return True
 
             # 根据文件扩展名选择加载方式
             ext = os.path.splitext(file_path)[1].lower()
 
             if ext == '.csv':
-                return self._load_csv(file_path)
+                loaded = self._load_csv(file_path)
             elif ext in ['.xlsx', '.xls']:
-                return self._load_excel(file_path)
+                loaded = self._load_excel(file_path)
             else:
                 logger.error(f"不支持的文件格式: {ext}")
                 return False
 
+            if loaded:
+                self._cache_key = cache_key
+                self._cache_rows = [(a.index, a.title, a.content) for a in self.articles]
+            self._unpublished = dict.fromkeys(self.articles)
+            return loaded
+
         except Exception as e:
             logger.error(f"加载文件失败: {e}")
             return False
@@ -68,23 +106,29 @@ class ExcelReader:
     def _load_csv(self, file_path: str) -> bool:
         """加载CSV文件（跳过第一行标题）"""
         try:
-            # 尝试不同的编码
-            encodings = ['utf-8', 'gbk', 'gb2312', 'utf-8-sig']
+            # 先用文件头判断编码，通常一次就能读完整个文件；
+            # 文件后半部分解码失败时再依次尝试其余编码
+            detected = self._detect_encoding(file_path)
+            encodings = [detected] if detected else []
+            encodings += [enc for enc in _CSV_ENCODINGS if enc != detected]
 
             for encoding in encodings:
                 try:
-                    with open(file_path, 'r', encoding=encoding, newline='') as f:
+                    with open(file_path, 'r', encoding=encoding, newline='',
+                              buffering=_CSV_BUFFER_SIZE) as f:
                         reader = csv.reader(f)
                         # 跳过第一行（标题行）
                         next(reader, None)
 
+                        # csv.reader 的单元格已经是 str，循环内只用局部变量
+                        append = self.articles.append
+                        strip = str.strip
                         for idx, row in enumerate(reader, start=1):
                             if len(row) >= 2 and row[0] and row[1]:
-                                title = str(row[0]).strip()
-                                content = str(row[1]).strip()
+                                title = strip(row[0])
+                                content = strip(row[1])
                                 if title and content:
-                                    article = Article(idx, title, content)
-                                    self.articles.append(article)
+                                    append(Article(idx, title, content))
 
                     logger.info(f"成功加载CSV文件 {len(self.articles)} 篇文章 (编码: {encoding})")
                     return True
@@ -99,20 +143,101 @@ class ExcelReader:
             logger.error(f"加载CSV失败: {e}")
             return False
 
+    @staticmethod
+    def _detect_encoding(file_path: str) -> str | None:
+        """根据文件头判断CSV编码，都无法解码时返回 None"""
+        with open(file_path, 'rb') as f:
+            prefix = f.read(_ENCODING_SNIFF_SIZE)
+
+        for encoding in _CSV_ENCODINGS:
+            try:
+                # 增量解码，文件头末尾被截断的多字节字符不算错误
+                codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+            except UnicodeDecodeError:
+                continue
+            return encoding
+        return None
+
+    @staticmethod
+    def _rows_to_articles(rows) -> List[Article]:
+        """将表格数据行（标题, 内容, ...）转换为文章列表，序号从 1 开始，跳过空行"""
+        return [
+            Article(idx, title, content)
+            for idx, row in enumerate(rows, start=1)
+            if len(row) >= 2 and row[0] and row[1]
+            and (title := str(row[0]).strip())
+            and (content := str(row[1]).strip())
+        ]
+
+    @staticmethod
+    def _calamine_cell(value):
+        """把 calamine 的单元格值转换成与 openpyxl 一致的类型
+
+        calamine 把所有数字读成 float、日期读成 date，直接 str() 会得到
+        '2025.0'、'2025-01-02'，而 openpyxl 得到 '2025'、'2025-01-02 00:00:00'。
+        """
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime.combine(value, time())
+        return value
+
+    @staticmethod
+    def _active_sheet_index(file_path: str) -> int:
+        """返回 openpyxl 视为活动工作表（wb.active）的序号
+
+        取 xl/workbook.xml 中 workbookView 的 activeTab；.xls 或读取失败时返回 0。
+        """
+        try:
+            with zipfile.ZipFile(file_path) as zf:
+                root = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+        except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            return 0
+        view = root.find('{*}bookViews/{*}workbookView')
+        try:
+            return int(view.get('activeTab', 0)) if view is not None else 0
+        except ValueError:
+            return 0
+
     def _load_excel(self, file_path: str) -> bool:
-        """加载Excel文件（跳过第一行标题）"""
+        """加载Excel文件（跳过第一行标题）
+
+        优先使用 python-calamine（Rust 实现，速度快得多，也支持 .xls），
+        未安装或读取失败时退回 openpyxl。
+        """
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            return self._load_excel_openpyxl(file_path)
+
+        try:
+            wb = CalamineWorkbook.from_path(file_path)
+            # 与 openpyxl 的 wb.active 读取同一个工作表
+            rows = wb.get_sheet_by_index(self._active_sheet_index(file_path)).to_python()
+
+            # 跳过第一行标题；只有标题、内容两列会用到，只转换这两列
+            cell = self._calamine_cell
+            self.articles = self._rows_to_articles(
+                [cell(v) for v in row[:2]] for row in islice(rows, 1, None)
+            )
+
+            logger.info(f"成功加载Excel文件 {len(self.articles)} 篇文章")
+            return True
+
+        except Exception as e:
+            logger.warning(f"calamine 读取Excel失败，改用 openpyxl: {e}")
+            return self._load_excel_openpyxl(file_path)
+
+    def _load_excel_openpyxl(self, file_path: str) -> bool:
+        """使用 openpyxl 加载Excel文件（跳过第一行标题）"""
+        from openpyxl import load_workbook
+
         try:
-            wb = load_workbook(file_path, read_only=True)
+            wb = load_workbook(file_path, read_only=True, data_only=True)
             ws = wb.active
 
             # min_row=2 跳过第一行标题
-            for idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=1):
-                if row[0] and row[1]:
-                    title = str(row[0]).strip()
-                    content = str(row[1]).strip()
-                    if title and content:
-                        article = Article(idx, title, content)
-                        self.articles.append(article)
+            self.articles = self._rows_to_articles(ws.iter_rows(min_row=2, values_only=True))
 
             wb.close()
             logger.info(f"成功加载Excel文件 {len(self.articles)} 篇文章")
@@ -128,12 +253,12 @@ class ExcelReader:
     
     def get_unpublished_articles(self, count: int) -> List[Article]:
         """获取指定数量的未发布文章"""
-        unpublished = [a for a in self.articles if not a.published]
-        return unpublished[:count]
+        return list(islice(self._unpublished, count))
     
     def mark_as_published(self, article: Article, result: str = "success"):
         """标记文章为已发布"""
         article.published = True
         article.publish_result = result
+        self._unpublished.pop(article, None)
         logger.info(f"文章已标记为发布: {article.title[:20]}... - {result}")
 
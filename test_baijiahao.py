@@ -1,12 +1,181 @@
 """测试百家号发布流程"""
 
 import asyncio
+import os
 import sys
+from types import SimpleNamespace
 sys.path.insert(0, '.')
 
 from src.browser.browser_manager import browser_manager
 from src.adapters.baijiahao_adapter import BaijiahaoAdapter, BaijiahaoSelectors
 from src.utils.excel_reader import ExcelReader, Article
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+
+class SelectorPlan:
+    """一组按优先级排列的候选选择器，同时预先拼好并集
+
+    候选全是 xpath= 时用 XPath 的 | 合并，否则按 CSS 用逗号合并（两者不能混用）。
+    """
+
+    __slots__ = ('selectors', 'union')
+
+    def __init__(self, *selectors):
+        self.selectors = selectors
+        if all(sel.startswith("xpath=") for sel in selectors):
+            self.union = "xpath=" + " | ".join(sel[len("xpath="):] for sel in selectors)
+        else:
+            self.union = ", ".join(selectors)
+
+
+# 发布流程各步骤的候选选择器（模块加载时构建一次，每篇文章直接复用）
+SELECTOR_PLAN = SimpleNamespace(
+    title=SelectorPlan(
+        BaijiahaoSelectors.TITLE_INPUT,
+        "textarea",
+        "[placeholder*='标题']",
+        ".title-input textarea",
+    ),
+    single_image=SelectorPlan(*BaijiahaoSelectors.SINGLE_IMAGE_SELECTORS),
+    auth_lib_tab=SelectorPlan(*BaijiahaoSelectors.AUTH_LIB_TAB_SELECTORS),
+    auth_lib_search=SelectorPlan(*BaijiahaoSelectors.AUTH_LIB_SEARCH_SELECTORS),
+    auth_lib_image=SelectorPlan(*BaijiahaoSelectors.AUTH_LIB_IMAGE_SELECTORS),
+    # 确认/发布按钮锚定在弹窗底部和操作栏上，不依赖兄弟节点序号
+    confirm=SelectorPlan(
+        "xpath=//*[contains(@id,'panel-authLib') or contains(@class,'authLib')]"
+        "//*[contains(@class,'bottom')]//button[contains(@class,'cheetah-btn-primary')]",
+        "xpath=//button[translate(normalize-space(.),' ','')='确定']",
+    ),
+    publish=SelectorPlan(
+        "xpath=//div[contains(@class,'op-list-right')]//button[translate(normalize-space(.),' ','')='发布']",
+        "xpath=//button[translate(normalize-space(.),' ','')='发布']",
+    ),
+)
+
+
+# 在页面内按优先级找到第一个可见的引导弹窗关闭按钮并点击，返回命中的选择器（没有时返回 null）
+# （:has-text 不是标准 CSS，文字按钮在页面内按文本匹配；'下一步'、'完成' 在编辑页上也是
+# 表单/发布按钮，所以文字按钮只在引导/弹窗容器内查找）
+_CLOSE_POPUPS_JS = """
+() => {
+    const visible = el => el.getClientRects().length > 0;
+    const guides = [...document.querySelectorAll('.cheetah-tour, .cheetah-modal, .ant-modal')];
+    const byText = text => {
+        for (const box of guides) {
+            const btn = [...box.querySelectorAll('button')]
+                .find(b => visible(b) && b.innerText.trim() === text);
+            if (btn) return btn;
+        }
+        return null;
+    };
+    const plan = [
+        '.cheetah-tour-close', '.cheetah-tour-skip',
+        {text: '跳过'}, {text: '知道了'}, {text: '我知道了'}, {text: '下一步'}, {text: '完成'},
+        '.tour-close', "[aria-label='Close']", '.cheetah-modal-close', '.ant-modal-close',
+        "svg[class*='close']",
+    ];
+    for (const item of plan) {
+        const el = typeof item === 'string'
+            ? [...document.querySelectorAll(item)].find(visible)
+            : byText(item.text);
+        if (el) {
+            el.dispatchEvent(new MouseEvent('click', {bubbles: true}));
+            return typeof item === 'string' ? item : `button:${item.text}`;
+        }
+    }
+    return null;
+}
+"""
+
+
+# 在页面内一次完成封面图片选择：免费正版图库标签 → 搜索 → 选图 → 确认
+# 每步等待目标元素出现（逐帧检查），返回各步命中的元素；失败时 failed 为失败的步骤
+_PICK_COVER_JS = """
+async (keyword) => {
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    const waitFor = async (find, timeout) => {
+        const deadline = Date.now() + timeout;
+        while (Date.now() < deadline) {
+            const el = find();
+            if (el) return el;
+            await nextFrame();
+        }
+        return null;
+    };
+    const click = el => el.dispatchEvent(new MouseEvent('click', {bubbles: true}));
+    const status = {};
+
+    // 步骤6: 免费正版图库标签
+    const tab = await waitFor(() =>
+        document.querySelector("[id^='rc-tabs-'][id$='-tab-authLib']")
+        || [...document.querySelectorAll("[role='tab']")].find(t => t.innerText.includes('免费正版')), 8000);
+    if (!tab) return {...status, failed: 'tab'};
+    click(tab);
+    status.tab = tab.id || 'role=tab';
+
+    // 步骤7: 搜索（React 受控输入框需要用原生 setter 赋值再派发 input 事件）
+    const panel = await waitFor(() =>
+        document.querySelector("[id^='rc-tabs-'][id$='-panel-authLib'], [class*='authLib']"), 8000);
+    const input = panel && await waitFor(() => panel.querySelector('input'), 8000);
+    if (!input) return {...status, failed: 'search'};
+    const firstImage = () => panel.querySelector('.pubu-content > div > img');
+    const before = firstImage()?.src;
+    input.focus();
+    Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(input, keyword);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    for (const type of ['keydown', 'keypress', 'keyup']) {
+        input.dispatchEvent(new KeyboardEvent(type, {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));
+    }
+    status.search = panel.id || 'authLib';
+
+    // 步骤8: 等搜索结果刷新（第一张图变化），和原流程一样优先选第5张
+    await waitFor(() => { const img = firstImage(); return img && img.src !== before ? img : null; }, 5000);
+    const images = [...panel.querySelectorAll('.pubu-content > div > img')];
+    const image = images[4] || images[3] || images[2] || images[0];
+    if (!image) return {...status, failed: 'image'};
+    click(image);
+    status.image = images.indexOf(image) + 1;
+
+    // 步骤9: 确认按钮（选图后才可点击）
+    const confirm = await waitFor(() => {
+        const btn = panel.querySelector("[class*='bottom'] button.cheetah-btn-primary")
+            || [...document.querySelectorAll('button')].find(b => b.innerText.replace(/\\s/g, '') === '确定');
+        return btn && !btn.disabled ? btn : null;
+    }, 8000);
+    if (!confirm) return {...status, failed: 'confirm'};
+    click(confirm);
+    status.confirm = true;
+    return status;
+}
+"""
+
+
+async def first_match(page, plan: SelectorPlan, timeout=5000):
+    """等待任一候选选择器出现，返回 (元素, 选择器)
+
+    所有候选合并成一个 CSS 并集只等待一次，不再逐个等待超时；
+    命中后按列表顺序取优先级最高的那个。超时抛出异常。
+    """
+    await page.wait_for_selector(plan.union, timeout=timeout)
+    for selector in plan.selectors:
+        element = await page.query_selector(selector)
+        if element:
+            return element, selector
+    raise LookupError(f"元素已消失: {plan.union}")
+
+
+async def click_first(page, plan: SelectorPlan, step: str, *, timeout=8000, force=False) -> bool:
+    """点击候选选择器中第一个出现的元素并打印结果，返回是否点击成功"""
+    try:
+        element, selector = await first_match(page, plan, timeout=timeout)
+        await element.click(force=force)
+    except Exception:
+        logger.warning(f"❌ 所有{step}选择器都失败")
+        return False
+    logger.info(f"✅ 点击{step}成功: {selector[:50]}")
+    return True
 
 
 async def debug_find_content_editor():
@@ -72,8 +241,22 @@ async def debug_find_content_editor():
 
         # 分析 iframe
         print("\n分析页面上的 iframe...")
-        iframes = await page.query_selector_all("iframe")
+        # 一次 evaluate 取回所有 iframe 的信息（尺寸、位置、是否为正文 body.view），不再逐个 frame 查询
+        iframes = await page.evaluate("""
+            () => Array.from(document.querySelectorAll('iframe')).map((f, i) => {
+                const r = f.getBoundingClientRect();
+                let isView = false;
+                try {
+                    isView = !!f.contentDocument?.querySelector('body.view');
+                } catch (_) {}
+                return {i, id: f.id, src: f.src, width: r.width, height: r.height, top: r.top, isView};
+            })
+        """)
         print(f"找到 {len(iframes)} 个 iframe")
+        for item in iframes:
+            mark = " ✅ 正文 body.view" if item['isView'] else ""
+            print(f"  [{item['i']}] id: {item['id'] or '-'}, 尺寸: {item['width']:.0f}x{item['height']:.0f}, "
+                  f"top={item['top']:.0f}, src: {item['src'][:50] or 'blank'}{mark}")
 
         # 尝试找到正文编辑器的具体选择器
         print("\n尝试各种正文选择器...")
@@ -89,25 +272,38 @@ async def debug_find_content_editor():
             ".edui-body-container",
         ]
 
-        for selector in selectors_to_test:
-            try:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    print(f"  ✅ {selector} - 找到 {len(elements)} 个元素")
-                    for i, el in enumerate(elements):
-                        box = await el.bounding_box()
-                        if box:
-                            print(f"      [{i}] 尺寸: {box['width']:.0f}x{box['height']:.0f}")
-            except Exception as e:
-                print(f"  ❌ {selector} - 错误: {str(e)[:30]}")
+        # 所有选择器在页面内一次查完，元素尺寸也一并取回
+        selector_results = await page.evaluate("""
+            (selectors) => selectors.map(selector => {
+                try {
+                    const boxes = [...document.querySelectorAll(selector)].map(el => {
+                        const rect = el.getBoundingClientRect();
+                        return {width: rect.width, height: rect.height};
+                    });
+                    return {selector, boxes};
+                } catch (e) {
+                    return {selector, error: String(e)};
+                }
+            })
+        """, selectors_to_test)
+
+        for item in selector_results:
+            selector = item['selector']
+            if 'error' in item:
+                print(f"  ❌ {selector} - 错误: {item['error'][:30]}")
+            elif item['boxes']:
+                print(f"  ✅ {selector} - 找到 {len(item['boxes'])} 个元素")
+                for i, box in enumerate(item['boxes']):
+                    if box['width'] or box['height']:
+                        print(f"      [{i}] 尺寸: {box['width']:.0f}x{box['height']:.0f}")
 
         print("\n" + "=" * 50)
         print("浏览器保持打开，请手动检查页面结构...")
         print("按 Ctrl+C 退出")
         print("=" * 50)
 
-        while True:
-            await asyncio.sleep(10)
+        # 空等事件，空闲时不再定时唤醒
+        await asyncio.Event().wait()
 
     except Exception as e:
         print(f"调试出错: {e}")
@@ -115,280 +311,165 @@ async def debug_find_content_editor():
         traceback.print_exc()
 
 
-async def publish_single_article(adapter, page, article, article_index, total_articles):
-    """发布单篇文章"""
-    print(f"\n{'=' * 50}")
-    print(f"正在发布第 {article_index + 1}/{total_articles} 篇文章")
-    print(f"标题: {article.title[:40]}...")
-    print(f"{'=' * 50}")
+async def pick_cover_image_stepwise(page):
+    """逐步选择封面图片（页面内流程失败时的备用方案）"""
+    # 步骤6: 点击"免费正版图库"标签（跳过图片选择框）
+    logger.debug("[步骤6] 点击免费正版图库标签...")
+    await click_first(page, SELECTOR_PLAN.auth_lib_tab, "免费正版图库标签")
+
+    # 步骤7: 搜索"渡鸦"
+    logger.debug("[步骤7] 搜索渡鸦...")
+    searched = False
+    try:
+        # 候选输入框等价，直接用并集 locator 填写（自动等待、聚焦，一次操作完成）
+        await page.locator(SELECTOR_PLAN.auth_lib_search.union).first.fill("渡鸦", timeout=8000)
+        logger.info("✅ 输入搜索词成功")
+        searched = True
+    except Exception:
+        pass
+    if searched:
+        await page.keyboard.press("Enter")
+        logger.info("✅ 按回车搜索")
+        # 搜索前图库里已有默认图片，没有可等待的元素，留一点时间让结果刷新
+        await asyncio.sleep(1)
+    else:
+        logger.warning("❌ 搜索输入失败")
+
+    # 步骤8: 选择图片（点击图片本身，模拟真人）
+    logger.debug("[步骤8] 选择图片（点击图片）...")
+    # 使用 force=True 确保点击成功
+    await click_first(page, SELECTOR_PLAN.auth_lib_image, "图片", force=True)
+
+    # 步骤9: 点击确认按钮
+    logger.debug("[步骤9] 点击确认按钮...")
+    await click_first(page, SELECTOR_PLAN.confirm, "确认按钮")
+
+
+async def publish_single_article(adapter, page, title, content, article_index, total_articles):
+    """发布单篇文章（标题、正文已在发布前统一整理好）"""
+    logger.info(f"正在发布第 {article_index + 1}/{total_articles} 篇文章: {title[:40]}...")
 
     # 步骤1: 进入后台首页
-    print("\n[步骤1] 进入后台首页...")
+    logger.debug("[步骤1] 进入后台首页...")
     await page.goto(adapter.HOME_URL, wait_until="domcontentloaded", timeout=30000)
-    await asyncio.sleep(3)
-    print(f"当前URL: {page.url}")
+    try:
+        await page.wait_for_load_state("networkidle", timeout=15000)
+    except Exception:
+        pass  # 页面有长连接时等不到网络空闲，不影响后续步骤
+    logger.debug(f"当前URL: {page.url}")
 
     # 步骤2: 点击发布作品按钮
-    print("\n[步骤2] 点击发布作品按钮...")
+    logger.debug("[步骤2] 点击发布作品按钮...")
     await page.click(BaijiahaoSelectors.PUBLISH_WORK_BTN)
-    await asyncio.sleep(3)
-    print(f"点击后URL: {page.url}")
+    # 等编辑页的标题输入框出现，而不是固定等待
+    try:
+        await page.wait_for_selector(SELECTOR_PLAN.title.union, state="attached", timeout=15000)
+    except Exception:
+        logger.warning("⚠️ 等待编辑页超时")
+    logger.debug(f"点击后URL: {page.url}")
 
     # 步骤2.5: 关闭新功能引导弹窗（如果存在）- 多次尝试
-    print("\n[步骤2.5] 检查并关闭新功能引导弹窗...")
-
-    # 多次尝试关闭弹窗（可能有多个引导步骤）
-    max_attempts = 5
-    for attempt in range(max_attempts):
-        closed_any = False
-
-        # 尝试多种关闭方式
-        close_selectors = [
-            ".cheetah-tour-close",
-            ".cheetah-tour-skip",
-            "button:has-text('跳过')",
-            "button:has-text('知道了')",
-            "button:has-text('我知道了')",
-            "button:has-text('下一步')",
-            "button:has-text('完成')",
-            ".tour-close",
-            "[aria-label='Close']",
-            ".cheetah-modal-close",
-            ".ant-modal-close",
-            "svg[class*='close']",
-        ]
+    logger.debug("[步骤2.5] 检查并关闭新功能引导弹窗...")
 
-        for selector in close_selectors:
-            try:
-                element = await page.wait_for_selector(selector, timeout=1000)
-                if element:
-                    await element.click()
-                    print(f"  ✅ 关闭弹窗成功[{attempt+1}]: {selector}")
-                    await asyncio.sleep(0.5)
-                    closed_any = True
-                    break
-            except Exception:
-                continue
-
-        # 如果没找到关闭按钮，尝试按ESC键
-        if not closed_any:
-            await page.keyboard.press("Escape")
-            await asyncio.sleep(0.5)
-
-        # 检查是否还有弹窗
-        try:
-            still_has_tour = await page.query_selector(".cheetah-tour, .cheetah-modal, .ant-modal")
-            if not still_has_tour:
-                print(f"  ✅ 所有弹窗已关闭（尝试{attempt+1}次）")
-                break
-        except:
+    # 引导可能有多步，点击后下一步的按钮才会出现，每轮只点击一个按钮，最多处理 5 轮
+    for attempt in range(5):
+        selector = await page.evaluate(_CLOSE_POPUPS_JS)
+        if not selector:
             break
-
+        logger.info(f"✅ 关闭弹窗成功[{attempt+1}]: {selector}")
         await asyncio.sleep(0.5)
 
     # 最后再按一次ESC确保
     await page.keyboard.press("Escape")
-    await asyncio.sleep(1)
-    print("✅ 引导弹窗处理完成")
+    logger.info("✅ 引导弹窗处理完成")
 
     # 步骤3: 填写标题（使用fill方法直接复制）
-    print("\n[步骤3] 填写标题...")
-    await asyncio.sleep(2)  # 步骤间隔
+    logger.debug("[步骤3] 填写标题...")
     try:
-        # 尝试多个可能的标题选择器
-        title_selectors = [
-            BaijiahaoSelectors.TITLE_INPUT,
-            "textarea",
-            "[placeholder*='标题']",
-            ".title-input textarea",
-        ]
-
-        title_filled = False
-        for selector in title_selectors:
-            try:
-                await page.fill(selector, article.title)
-                print(f"✅ 标题已填写: {article.title[:30]}... (选择器: {selector[:30]})")
-                title_filled = True
-                break
-            except Exception as e:
-                print(f"⚠️ 标题选择器失败: {selector[:30]}... - {str(e)[:50]}")
-                continue
-
-        if not title_filled:
-            print("❌ 所有标题选择器都失败了")
+        element, selector = await first_match(page, SELECTOR_PLAN.title, timeout=8000)
+        await element.fill(title)
+        logger.info(f"✅ 标题已填写: {title[:30]}... (选择器: {selector[:30]})")
     except Exception as e:
-        print(f"❌ 填写标题失败: {e}")
-
-    await asyncio.sleep(3)  # 步骤间隔
+        logger.warning(f"❌ 填写标题失败: {str(e)[:50]}")
 
     # 步骤4: 填写正文（正文在iframe里，使用UEditor）
-    print("\n[步骤4] 填写正文（iframe内的UEditor）...")
+    logger.debug("[步骤4] 填写正文（iframe内的UEditor）...")
     try:
-        # 找到UEditor的iframe
-        ueditor_frame = page.frame_locator("#ueditor_0")
-
-        # 在iframe内找到body并填写内容
-        body_element = ueditor_frame.locator("body")
+        # 每篇文章只解析一次编辑器 body；属性前缀选择器同时兼容 #ueditor_0 和带版本号的 ID
+        body_element = page.frame_locator("iframe[id^='ueditor']").first.locator("body")
+        await body_element.wait_for(state="attached", timeout=10000)
         await body_element.click()
-        await asyncio.sleep(0.5)
 
         # 清空现有内容并输入新内容
-        await body_element.fill(article.content)
-        print(f"✅ 正文已填写: {article.content[:50]}...")
+        await body_element.fill(content)
+        logger.info(f"✅ 正文已填写: {content[:50]}...")
     except Exception as e:
-        print(f"⚠️ iframe方式失败: {e}")
-
-        # 备用方案：直接获取iframe并操作
-        try:
-            print("尝试备用方案...")
-            frames = page.frames
-            print(f"页面共有 {len(frames)} 个frame")
-
-            for i, frame in enumerate(frames):
-                frame_url = frame.url
-                print(f"  Frame[{i}]: {frame_url[:50] if frame_url else 'blank'}")
-
-                # 尝试在每个frame中找body
-                try:
-                    body = await frame.query_selector("body.view")
-                    if body:
-                        print(f"  ✅ 在Frame[{i}]找到body.view")
-                        await body.click()
-                        await asyncio.sleep(0.5)
-                        await frame.fill("body", article.content)
-                        print(f"✅ 正文已填写（备用方案）")
-                        break
-                except:
-                    continue
-        except Exception as e2:
-            print(f"❌ 备用方案也失败: {e2}")
-
-    await asyncio.sleep(3)  # 步骤间隔
+        logger.warning(f"❌ 正文填写失败: {e}")
 
     # 步骤5: 测试封面选项 - 使用多选择器策略
-    print("\n[步骤5] 测试封面选项（单图）...")
+    logger.debug("[步骤5] 测试封面选项（单图）...")
     try:
         # 滚动到封面区域
         await page.evaluate("window.scrollBy(0, 500)")
-        await asyncio.sleep(1)
 
         # 多选择器策略
-        single_image_clicked = False
-        for selector in BaijiahaoSelectors.SINGLE_IMAGE_SELECTORS:
-            try:
-                element = await page.wait_for_selector(selector, timeout=2000)
-                if element:
-                    await element.click()
-                    print(f"✅ 点击单图选项成功: {selector[:50]}")
-                    single_image_clicked = True
-                    break
-            except Exception:
-                print(f"  ⚠️ 选择器失败: {selector[:50]}")
-                continue
-
-        if not single_image_clicked:
+        if not await click_first(page, SELECTOR_PLAN.single_image, "单图选项"):
             # 最后尝试使用主选择器强制点击
             await page.click(BaijiahaoSelectors.SINGLE_IMAGE_RADIO, force=True)
-            print("✅ 点击单图选项成功（强制点击）")
+            logger.info("✅ 点击单图选项成功（强制点击）")
+    except Exception as e:
+        logger.warning(f"⚠️ 封面选项测试失败: {e}")
 
-        await asyncio.sleep(2)
+    # 步骤6-9: 在页面内一次完成 图库标签 → 搜索 → 选图 → 确认
+    logger.debug("[步骤6-9] 在页面内选择封面图片...")
+    try:
+        status = await page.evaluate(_PICK_COVER_JS, "渡鸦")
     except Exception as e:
-        print(f"⚠️ 封面选项测试失败: {e}")
+        status = {"failed": f"evaluate: {str(e)[:50]}"}
+    if status.get("failed"):
+        logger.warning(f"⚠️ 页面内流程失败（{status['failed']}），改为逐步操作")
+        await pick_cover_image_stepwise(page)
+    else:
+        logger.info(f"✅ 封面图片已选择: {status}")
+    try:
+        # 等图片弹窗关闭（封面上传完成），不再固定等待10秒
+        await page.wait_for_selector(".cheetah-modal", state="hidden", timeout=15000)
+    except Exception:
+        logger.warning("⚠️ 等待图片弹窗关闭超时")
 
-    # 步骤6: 点击"免费正版图库"标签（跳过图片选择框）
-    print("\n[步骤6] 点击免费正版图库标签...")
-    await asyncio.sleep(2)
-    clicked = False
-    for selector in BaijiahaoSelectors.AUTH_LIB_TAB_SELECTORS:
-        try:
-            element = await page.wait_for_selector(selector, timeout=2000)
-            if element:
-                await element.click()
-                print(f"✅ 点击免费正版图库标签成功: {selector[:50]}")
-                clicked = True
-                break
-        except Exception:
-            print(f"  ⚠️ 选择器失败: {selector[:50]}")
-    if not clicked:
-        print("❌ 所有免费正版图库标签选择器都失败")
-    await asyncio.sleep(2)
+    # 步骤10: 点击发布按钮
+    logger.debug("[步骤10] 点击发布按钮...")
+    await click_first(page, SELECTOR_PLAN.publish, "发布按钮")
 
-    # 步骤7: 搜索"渡鸦"
-    print("\n[步骤7] 搜索渡鸦...")
-    searched = False
-    for selector in BaijiahaoSelectors.AUTH_LIB_SEARCH_SELECTORS:
-        try:
-            element = await page.wait_for_selector(selector, timeout=2000)
-            if element:
-                await element.click()
-                await asyncio.sleep(0.5)
-                await page.fill(selector, "渡鸦")
-                print(f"✅ 输入搜索词成功: {selector[:50]}")
-                searched = True
-                break
-        except Exception:
-            print(f"  ⚠️ 选择器失败: {selector[:50]}")
-    if searched:
-        await asyncio.sleep(0.5)
-        await page.keyboard.press("Enter")
-        print("✅ 按回车搜索")
-    else:
-        print("❌ 搜索输入失败")
-    await asyncio.sleep(3)
+    # 发布请求没有可等待的页面信号，留时间让请求发出后再进入下一篇
+    await asyncio.sleep(5)
+    logger.info(f"✅ 第 {article_index + 1}/{total_articles} 篇文章发布完成!")
 
-    # 步骤8: 选择图片（点击图片本身，模拟真人）
-    print("\n[步骤8] 选择图片（点击图片）...")
-    clicked = False
-    for selector in BaijiahaoSelectors.AUTH_LIB_IMAGE_SELECTORS:
-        try:
-            element = await page.wait_for_selector(selector, timeout=2000)
-            if element:
-                # 使用 force=True 确保点击成功
-                await element.click(force=True)
-                print(f"✅ 选择图片成功: {selector[:50]}")
-                clicked = True
-                break
-        except Exception:
-            print(f"  ⚠️ 选择器失败: {selector[:50]}")
-    if not clicked:
-        print("❌ 所有图片选择器都失败")
-    await asyncio.sleep(2)
 
-    # 步骤9: 点击确认按钮
-    print("\n[步骤9] 点击确认按钮...")
-    clicked = False
-    for selector in BaijiahaoSelectors.CONFIRM_BTN_SELECTORS:
-        try:
-            element = await page.wait_for_selector(selector, timeout=3000)
-            if element:
-                await element.click()
-                print(f"✅ 点击确认按钮成功")
-                clicked = True
-                break
-        except Exception:
-            print(f"  ⚠️ 选择器失败: {selector[:50]}")
-    if not clicked:
-        print("❌ 所有确认按钮选择器都失败")
-    await asyncio.sleep(10)
+# 同一账号同时发布的页面数（平台对单账号有频率限制，不宜过大）
+PUBLISH_CONCURRENCY = 2
 
-    # 步骤10: 点击发布按钮
-    print("\n[步骤10] 点击发布按钮（等待10秒后）...")
-    clicked = False
-    for selector in BaijiahaoSelectors.PUBLISH_BTN_SELECTORS:
-        try:
-            element = await page.wait_for_selector(selector, timeout=3000)
-            if element:
-                await element.click()
-                print(f"✅ 点击发布按钮成功")
-                clicked = True
-                break
-        except Exception:
-            print(f"  ⚠️ 选择器失败: {selector[:50]}")
-    if not clicked:
-        print("❌ 所有发布按钮选择器都失败")
 
-    await asyncio.sleep(5)
-    print(f"\n✅ 第 {article_index + 1}/{total_articles} 篇文章发布完成!")
+class PagePool:
+    """同一登录上下文中的页面池，最多同时占用 size 个页面"""
+
+    def __init__(self, first_page, size: int):
+        self._context = first_page.context
+        self._size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._idle.put_nowait(first_page)
+        self._created = 1
+
+    async def acquire(self):
+        """取一个空闲页面，没有空闲且未达上限时新建"""
+        if self._idle.empty() and self._created < self._size:
+            self._created += 1
+            return await self._context.new_page()
+        return await self._idle.get()
+
+    def release(self, page):
+        """归还页面"""
+        self._idle.put_nowait(page)
 
 
 async def test_publish():
@@ -417,15 +498,26 @@ async def test_publish():
         # 获取页面
         page = await adapter.get_page()
 
-        # 循环发布所有文章
+        # 多个页面共用登录状态，并发发布所有文章
+        pool = PagePool(page, size=PUBLISH_CONCURRENCY)
         total_articles = len(reader.articles)
-        for i, article in enumerate(reader.articles):
-            await publish_single_article(adapter, page, article, i, total_articles)
 
-            # 如果不是最后一篇，等待一段时间再发布下一篇
-            if i < total_articles - 1:
-                print(f"\n⏳ 等待5秒后发布下一篇...")
-                await asyncio.sleep(5)
+        # 发布前一次性取出标题、正文两列，浏览器循环里只按下标取值
+        titles = [article.title for article in reader.articles]
+        contents = [article.content for article in reader.articles]
+
+        async def publish_via_pool(i):
+            pool_page = await pool.acquire()
+            try:
+                await publish_single_article(adapter, pool_page, titles[i], contents[i], i, total_articles)
+                # 同一页面发布下一篇前等待一段时间
+                if i < total_articles - 1:
+                    logger.debug("⏳ 等待5秒后发布下一篇...")
+                    await asyncio.sleep(5)
+            finally:
+                pool.release(pool_page)
+
+        await asyncio.gather(*(publish_via_pool(i) for i in range(total_articles)))
 
         print("\n" + "=" * 50)
         print(f"🎉 所有 {total_articles} 篇文章发布完成!")
@@ -438,6 +530,11 @@ async def test_publish():
 
 
 if __name__ == "__main__":
+    # 发布过程的逐步日志默认只输出警告，PUBLISH_LOG=INFO/DEBUG 可查看更多；
+    # enqueue=True 由后台线程写出，不阻塞发布流程
+    logger.remove()
+    logger.add(sys.stdout, level=os.environ.get("PUBLISH_LOG", "WARNING"), enqueue=True)
+
     # 运行发布测试
     asyncio.run(test_publish())
 
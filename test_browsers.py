@@ -12,8 +12,11 @@ import os
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 BROWSER_PROFILES_DIR = os.path.join(BASE_DIR, "data", "browser_profiles")
 
-async def open_browser(profile_dir: str, name: str, url: str):
-    """打开一个浏览器窗口"""
+# HEADLESS=1 时无界面运行（CI/无人值守时不需要渲染窗口）
+HEADLESS = os.environ.get("HEADLESS", "0") == "1"
+
+async def open_browser(playwright, profile_dir: str, name: str, url: str):
+    """打开一个浏览器窗口（两个窗口共用同一个 Playwright 实例）"""
     profile_path = os.path.join(BROWSER_PROFILES_DIR, profile_dir)
     storage_file = os.path.join(profile_path, "storage_state.json")
     
@@ -22,18 +25,22 @@ async def open_browser(profile_dir: str, name: str, url: str):
     print(f"  登录状态文件: {storage_file}")
     print(f"  登录状态文件存在: {os.path.exists(storage_file)}")
     
-    playwright = await async_playwright().start()
-    
-    # 启动浏览器（有头模式）
-    browser = await playwright.chromium.launch(
-        headless=False,
-        args=['--start-maximized']
-    )
+    # 启动浏览器（默认有头模式）
+    if HEADLESS:
+        args = [
+            '--disable-blink-features=AutomationControlled',
+            '--disable-gpu',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+        ]
+    else:
+        args = ['--start-maximized']
+    browser = await playwright.chromium.launch(headless=HEADLESS, args=args)
     
     # 创建上下文，如果有存储状态则加载
-    context_options = {
-        'viewport': None,  # 使用最大化窗口
-    }
+    context_options = {}
+    if not HEADLESS:
+        context_options['viewport'] = None  # 使用最大化窗口
     
     if os.path.exists(storage_file):
         context_options['storage_state'] = storage_file
@@ -48,52 +55,51 @@ async def open_browser(profile_dir: str, name: str, url: str):
     await page.goto(url)
     print(f"  已打开: {url}")
     
-    return playwright, browser, context, page
+    return browser, context, page
 
 async def main():
     print("=" * 60)
     print("测试两个账号的浏览器窗口")
     print("=" * 60)
     
-    # 今日头条账号6
-    toutiao_result = await open_browser(
-        profile_dir="toutiao_account6",
-        name="今日头条-账号6",
-        url="https://mp.toutiao.com/profile_v4/index"
-    )
-    
-    print()
-    
-    # 搜狐-susu说流量
-    sohu_result = await open_browser(
-        profile_dir="sohu_account2",
-        name="搜狐-susu说流量",
-        url="https://mp.sohu.com/mpfe/v4/main/index"
-    )
-    
-    print()
-    print("=" * 60)
-    print("两个浏览器已打开，请检查登录状态")
-    print("按 Ctrl+C 退出并关闭浏览器")
-    print("=" * 60)
-    
-    # 保持运行，不要退出
-    try:
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
-        print("\n正在关闭浏览器...")
-        
-        # 关闭浏览器
-        await toutiao_result[2].close()  # context
-        await toutiao_result[1].close()  # browser
-        await toutiao_result[0].stop()   # playwright
-        
-        await sohu_result[2].close()
-        await sohu_result[1].close()
-        await sohu_result[0].stop()
-        
-        print("已关闭所有浏览器")
+    async with async_playwright() as playwright:
+        # 两个窗口同时启动：今日头条账号6、搜狐-susu说流量
+        toutiao_result, sohu_result = await asyncio.gather(
+            open_browser(
+                playwright,
+                profile_dir="toutiao_account6",
+                name="今日头条-账号6",
+                url="https://mp.toutiao.com/profile_v4/index"
+            ),
+            open_browser(
+                playwright,
+                profile_dir="sohu_account2",
+                name="搜狐-susu说流量",
+                url="https://mp.sohu.com/mpfe/v4/main/index"
+            ),
+        )
+
+        print()
+        print("=" * 60)
+        print("两个浏览器已打开，请检查登录状态")
+        print("按 Ctrl+C 退出并关闭浏览器")
+        print("=" * 60)
+
+        # 保持运行，不要退出（空等事件，空闲时不再定时唤醒）
+        # Python 3.11+ 按 Ctrl+C 时 asyncio.run 会取消主任务，这里收到的是 CancelledError
+        try:
+            await asyncio.Event().wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n正在关闭浏览器...")
+
+            # 关闭浏览器（Playwright 由 async with 退出时停止）
+            await toutiao_result[1].close()  # context
+            await toutiao_result[0].close()  # browser
+
+            await sohu_result[1].close()
+            await sohu_result[0].close()
+
+            print("已关闭所有浏览器")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,21 +1,67 @@
 """完整流程测试：检测头条号发布全流程的所有选择器"""
 import asyncio
-import os
-from playwright.async_api import async_playwright
+import sys
+sys.path.insert(0, '.')
+
+from src.browser.browser_manager import browser_manager
 
 TEST_TITLE = "2025流量获取工具前十！墨鸦AI自动化矩阵登顶推荐"
 TEST_CONTENT = "2025年，创业者面临最大的核心问题始终未变——如何降低获取成本。数据显示，超过60%的实体老板缺乏系统运营工具，导致流量转化率不足3%。在众多流量获取工具中，墨鸦AI以42个行业的实战验证数据，荣登榜单成为2025年流量获取工具前十。"
 
+# 素材库选图、点确定的页面脚本：创建上下文时注入一次，每个页面加载时只解析一次，
+# 之后 evaluate 只需调用 window.__pickImage() / window.__clickConfirm()
+PICKER_JS = """
+window.__pickImage = () => {
+    // 查找素材库中的图片
+    const imgs = document.querySelectorAll('.byte-drawer img');
+    if (imgs.length > 0) {
+        imgs[0].click();
+        return 'clicked: .byte-drawer img';
+    }
+    const spans = document.querySelectorAll('.byte-drawer .img-span');
+    if (spans.length > 0) {
+        spans[0].click();
+        return 'clicked: .byte-drawer .img-span';
+    }
+    // 查找ReactVirtualized中的图片
+    const vImg = document.querySelector('.ReactVirtualized__Grid img');
+    if (vImg) {
+        vImg.click();
+        return 'clicked: .ReactVirtualized__Grid img';
+    }
+    return 'not found';
+};
+
+window.__clickConfirm = () => {
+    // 查找footer中的确定按钮
+    const btns = document.querySelectorAll('.byte-drawer button');
+    for (let btn of btns) {
+        if (btn.innerText.includes('确定') || btn.innerText.includes('确 定')) {
+            btn.click();
+            return 'clicked: .byte-drawer button[确定]';
+        }
+    }
+    // 查找primary按钮
+    const primary = document.querySelector('.byte-drawer .byte-btn-primary');
+    if (primary) {
+        primary.click();
+        return 'clicked: .byte-drawer .byte-btn-primary';
+    }
+    return 'not found';
+};
+"""
+
 async def test_full_flow():
-    """测试完整发布流程并输出正确选择器"""
-    profile_dir = "data/browser_profiles/toutiao_account5"
-    storage_file = os.path.join(profile_dir, "storage_state.json")
+    """测试完整发布流程并输出正确选择器
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context(storage_state=storage_file) if os.path.exists(storage_file) else await browser.new_context()
-        page = await context.new_page()
+    浏览器和登录上下文由全局 browser_manager 提供，
+    同一进程中运行多个测试流程时共用一个 Chromium。
+    """
+    context = await browser_manager.get_context("toutiao_5", "toutiao_account5")
+    await context.add_init_script(script=PICKER_JS)
+    page = await context.new_page()
 
+    try:
         results = {}  # 记录成功的选择器
 
         # 1. 打开发布页面
@@ -50,20 +96,17 @@ async def test_full_flow():
             ".article-cover-images-wrap .article-cover-images > div > div > div > div",
             ".article-cover-images-wrap",
         ]
-        cover_clicked = False
-        for sel in cover_selectors:
-            try:
-                cover_elem = await page.wait_for_selector(sel, timeout=3000)
+        try:
+            # 候选选择器合并成一个并集只等待一次，命中后按优先级取元素
+            await page.wait_for_selector(", ".join(cover_selectors), timeout=3000)
+            for sel in cover_selectors:
+                cover_elem = await page.query_selector(sel)
                 if cover_elem:
                     await cover_elem.click(force=True)
                     results["封面区域"] = sel
                     print(f"  ✓ 封面点击成功: {sel[:60]}...")
-                    cover_clicked = True
                     break
-            except:
-                print(f"  ✗ 失败: {sel[:50]}...")
-                continue
-        if not cover_clicked:
+        except:
             print("  所有封面选择器都失败")
         await asyncio.sleep(3)
 
@@ -94,26 +137,7 @@ async def test_full_flow():
 
         # 6. 选择第一张图片
         print("[6] 选择图片...")
-        img_sel = await page.evaluate("""() => {
-            // 查找素材库中的图片
-            const imgs = document.querySelectorAll('.byte-drawer img');
-            if (imgs.length > 0) {
-                imgs[0].click();
-                return 'clicked: .byte-drawer img';
-            }
-            const spans = document.querySelectorAll('.byte-drawer .img-span');
-            if (spans.length > 0) {
-                spans[0].click();
-                return 'clicked: .byte-drawer .img-span';
-            }
-            // 查找ReactVirtualized中的图片
-            const vImg = document.querySelector('.ReactVirtualized__Grid img');
-            if (vImg) {
-                vImg.click();
-                return 'clicked: .ReactVirtualized__Grid img';
-            }
-            return 'not found';
-        }""")
+        img_sel = await page.evaluate("() => window.__pickImage()")
         print(f"  图片选择: {img_sel}")
         if "clicked" in img_sel:
             results["素材图片"] = img_sel.replace("clicked: ", "")
@@ -121,23 +145,7 @@ async def test_full_flow():
 
         # 7. 点击确定按钮
         print("[7] 点击确定按钮...")
-        confirm_sel = await page.evaluate("""() => {
-            // 查找footer中的确定按钮
-            const btns = document.querySelectorAll('.byte-drawer button');
-            for (let btn of btns) {
-                if (btn.innerText.includes('确定') || btn.innerText.includes('确 定')) {
-                    btn.click();
-                    return 'clicked: .byte-drawer button[确定]';
-                }
-            }
-            // 查找primary按钮
-            const primary = document.querySelector('.byte-drawer .byte-btn-primary');
-            if (primary) {
-                primary.click();
-                return 'clicked: .byte-drawer .byte-btn-primary';
-            }
-            return 'not found';
-        }""")
+        confirm_sel = await page.evaluate("() => window.__clickConfirm()")
         print(f"  确定按钮: {confirm_sel}")
         if "clicked" in confirm_sel:
             results["确定按钮"] = confirm_sel.replace("clicked: ", "")
@@ -162,9 +170,17 @@ async def test_full_flow():
         print("="*50)
 
         input("\n按Enter关闭浏览器...")
-        await context.close()
-        await browser.close()
+    finally:
+        await page.close()
+
+
+async def main():
+    try:
+        await test_full_flow()
+    finally:
+        await browser_manager.close_all()
+
 
 if __name__ == "__main__":
-    asyncio.run(test_full_flow())
+    asyncio.run(main())
 
@@ -0,0 +1,98 @@
+"""
+ExcelReader 测试：calamine 与 openpyxl 两种读取方式得到的文章必须一致
+
+运行: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook
+
+from src.utils.excel_reader import ExcelReader
+
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+
+def _articles(reader: ExcelReader):
+    return [(a.index, a.title, a.content) for a in reader.articles]
+
+
+@unittest.skipUnless(HAS_CALAMINE, "未安装 python-calamine")
+class CalamineOpenpyxlParityTest(unittest.TestCase):
+    """同一个工作簿分别用两种方式读取，文章完全相同"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(fd)
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['标题', '内容'])
+        ws.append([2025, 12345])                       # 整数
+        ws.append([datetime(2025, 1, 2), '日期标题'])   # 日期
+        ws.append([datetime(2025, 1, 2, 8, 30), 1.5])  # 日期时间、小数
+        ws.append(['普通标题', '普通正文'])
+        ws.append([None, '缺少标题的行'])
+        ws.append(['  前后空格  ', ' 正文 '])
+        wb.save(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_same_articles(self):
+        calamine_reader = ExcelReader()
+        self.assertTrue(calamine_reader._load_excel(self.path))
+
+        openpyxl_reader = ExcelReader()
+        self.assertTrue(openpyxl_reader._load_excel_openpyxl(self.path))
+
+        self.assertEqual(_articles(calamine_reader), _articles(openpyxl_reader))
+        self.assertEqual(_articles(calamine_reader)[:2], [
+            (1, '2025', '12345'),
+            (2, '2025-01-02 00:00:00', '日期标题'),
+        ])
+
+    def test_reads_active_sheet(self):
+        """活动工作表不是第一个时，两种方式都读取活动工作表"""
+        from openpyxl import load_workbook
+
+        wb = load_workbook(self.path)
+        other = wb.create_sheet('其他', 0)
+        other.append(['标题', '内容'])
+        other.append(['第一个工作表', '不应被读取'])
+        wb.active = 1
+        wb.save(self.path)
+
+        calamine_reader = ExcelReader()
+        self.assertTrue(calamine_reader._load_excel(self.path))
+
+        openpyxl_reader = ExcelReader()
+        self.assertTrue(openpyxl_reader._load_excel_openpyxl(self.path))
+
+        self.assertEqual(_articles(calamine_reader), _articles(openpyxl_reader))
+        self.assertNotIn('第一个工作表', [a.title for a in calamine_reader.articles])
+
+    def test_falls_back_to_openpyxl(self):
+        """calamine 读取出错时退回 openpyxl，而不是加载失败"""
+        reader = ExcelReader()
+        with mock.patch('python_calamine.CalamineWorkbook.from_path', side_effect=ValueError('boom')):
+            self.assertTrue(reader._load_excel(self.path))
+
+        openpyxl_reader = ExcelReader()
+        self.assertTrue(openpyxl_reader._load_excel_openpyxl(self.path))
+        self.assertEqual(_articles(reader), _articles(openpyxl_reader))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,9 @@
 import sys
 import os
 
-# 添加src目录到路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# 添加项目根目录到路径（所有模块统一通过 src.xxx 导入，
+# 不再把 src 目录本身加入路径，避免 utils.config 等模块以另一个名字被重复导入）
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt